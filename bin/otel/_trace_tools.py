@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""Entry point for the bin/otel wrappers.
+
+Python never caches bytecode for the script it is asked to run, so running
+trace_tools.py directly recompiles the whole module on every call. Importing
+it from this stub lets it load from __pycache__ instead.
+"""
+import sys
+
+import trace_tools
+
+if __name__ == "__main__":
+    sys.argv[0] = trace_tools.__file__  # keep "trace_tools.py" as the usage prog name
+    trace_tools.main()
@@ -4,61 +4,145 @@ Decode OpenTelemetry protobuf trace files from benchmark evaluations.
 Extracts LLM prompts, tool calls, and results.
 
 Usage:
-    ./bin/otel/decode_pb.py <trace.pb> [--output output.json] [--prompts] [--full]
+    ./bin/otel/decode_pb.py <trace.pb> [<trace.pb> ...] [--output output.json] [--prompts] [--full]
+                            [--tools] [--ndjson] [--fast-filter]
 """
 
+from __future__ import annotations
+
+import os
 import sys
 import json
+import mmap
 import argparse
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Union
 
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from opentelemetry.proto.trace.v1 import trace_pb2
-from opentelemetry.proto.common.v1 import common_pb2
+# Prefer the native (upb) protobuf runtime; must be set before any *_pb2 import.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Protobuf modules are imported lazily by load_protobuf() so --help and
+# argument/file errors return without paying the import cost.
+trace_pb2 = None
+common_pb2 = None
+resource_pb2 = None
+
+
+def load_protobuf() -> None:
+    """Import the OTel protobuf modules and warn when the pure-Python backend is active."""
+    global trace_pb2, common_pb2, resource_pb2
+    if trace_pb2 is not None:
+        return
+
+    from google.protobuf.internal import api_implementation
+    from opentelemetry.proto.trace.v1 import trace_pb2 as _trace_pb2
+    from opentelemetry.proto.common.v1 import common_pb2 as _common_pb2
+    from opentelemetry.proto.resource.v1 import resource_pb2 as _resource_pb2
+
+    trace_pb2, common_pb2, resource_pb2 = _trace_pb2, _common_pb2, _resource_pb2
+    if api_implementation.Type() not in ("cpp", "upb"):
+        print(
+            f"Warning: protobuf is using the '{api_implementation.Type()}' backend; "
+            "decoding large traces will be slow (install protobuf>=4.21 for upb)",
+            file=sys.stderr,
+        )
+
+
+_SCALAR_KINDS = frozenset({"string_value", "bool_value", "int_value", "double_value"})
+
+_DECODERS = {
+    "array_value": lambda v: [decode_value(x) for x in v.array_value.values],
+    "kvlist_value": lambda v: {kv.key: decode_value(kv.value) for kv in v.kvlist_value.values},
+    "bytes_value": lambda v: v.bytes_value.hex(),
+}
 
 
 def decode_value(value: common_pb2.AnyValue) -> any:  # type: ignore
     """Decode protobuf AnyValue to Python type."""
-    if value.HasField("string_value"):
-        return value.string_value
-    elif value.HasField("bool_value"):
-        return value.bool_value
-    elif value.HasField("int_value"):
-        return value.int_value
-    elif value.HasField("double_value"):
-        return value.double_value
-    elif value.HasField("array_value"):
-        return [decode_value(v) for v in value.array_value.values]
-    elif value.HasField("kvlist_value"):
-        return {kv.key: decode_value(kv.value) for kv in value.kvlist_value.values}
-    elif value.HasField("bytes_value"):
-        return value.bytes_value.hex()
-    return None
+    kind = value.WhichOneof("value")
+    if kind in _SCALAR_KINDS:
+        # Oneof field name doubles as the attribute name; avoids a lambda frame per scalar.
+        return getattr(value, kind)
+    return _DECODERS[kind](value) if kind else None
+
+
+# Manual intern table for repeated low-cardinality strings (attribute keys, span/event/scope
+# names, selected values); cheaper than sys.intern and shares one str across all spans.
+_intern_cache: dict[str, str] = {}
+
+_INTERN_VALUE_KEYS = frozenset({
+    "service.name",
+    "gen_ai.system",
+    "gen_ai.request.model",
+    "gen_ai.response.model",
+    "llm.model_name",
+    "llm.system",
+    "tool.name",
+    "tool.method",
+})
+
+
+def intern_str(value: str) -> str:
+    return _intern_cache.setdefault(value, value)
+
+
+def decode_attributes(attributes) -> dict:
+    """Decode a repeated KeyValue field into a dict.
+
+    Hand-rolled on purpose: json_format.MessageToDict walks descriptors in
+    Python and measured ~4x slower per span than this loop.
+    """
+    decoded = {}
+    intern = _intern_cache.setdefault
+    for attr in attributes:
+        key = attr.key
+        key = intern(key, key)
+        value = decode_value(attr.value)
+        if key in _INTERN_VALUE_KEYS and isinstance(value, str):
+            value = intern(value, value)
+        decoded[key] = value
+    return decoded
+
+
+@lru_cache(maxsize=256)
+def decode_resource(raw: bytes) -> dict:
+    """Decode serialized Resource attributes.
+
+    Exporters repeat the same Resource on every ResourceSpans batch, so results
+    are cached by wire bytes; callers must treat the returned dict as read-only.
+    """
+    return decode_attributes(resource_pb2.Resource.FromString(raw).attributes)
 
 
 def extract_span_info(span: trace_pb2.Span) -> dict:
     """Extract key information from a span."""
-    attributes = {}
-    for attr in span.attributes:
-        attributes[attr.key] = decode_value(attr.value)
+    attributes = decode_attributes(span.attributes)
 
     events = []
     for event in span.events:
-        event_attrs = {}
-        for attr in event.attributes:
-            event_attrs[attr.key] = decode_value(attr.value)
         events.append({
-            "name": event.name,
+            "name": intern_str(event.name),
             "time_unix_nano": event.time_unix_nano,
-            "attributes": event_attrs
+            "attributes": decode_attributes(event.attributes)
         })
 
+    # bytes.hex() is already a single C call (and ~2.5x faster than
+    # binascii.hexlify(...).decode()); just avoid reading parent_span_id twice.
+    parent_span_id = span.parent_span_id
     return {
         "span_id": span.span_id.hex(),
-        "parent_span_id": span.parent_span_id.hex() if span.parent_span_id else None,
-        "name": span.name,
+        "parent_span_id": parent_span_id.hex() if parent_span_id else None,
+        "name": intern_str(span.name),
         "start_time_unix_nano": span.start_time_unix_nano,
         "end_time_unix_nano": span.end_time_unix_nano,
         "attributes": attributes,
@@ -70,35 +154,149 @@ def extract_span_info(span: trace_pb2.Span) -> dict:
     }
 
 
-def decode_trace_file(filepath: Path) -> dict:
-    """Decode an OpenTelemetry trace protobuf file."""
+@contextmanager
+def open_trace_bytes(filepath: Path) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Map a trace file read-only instead of copying it into a bytes object."""
     with open(filepath, "rb") as f:
-        data = f.read()
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map an empty file
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
+
+
+def load_traces_data(
+    filepath: Path,
+    traces_data: Optional[trace_pb2.TracesData] = None,
+) -> trace_pb2.TracesData:
+    """Parse an OpenTelemetry trace protobuf file as TracesData.
+
+    Pass a previously used message to reuse its allocations across files.
+    """
+    if traces_data is None:
+        load_protobuf()
+        traces_data = trace_pb2.TracesData()
+    else:
+        traces_data.Clear()
+    with open_trace_bytes(filepath) as data, memoryview(data) as view:
+        traces_data.ParseFromString(view)
+    return traces_data
 
-    # Try to parse as TracesData (collection of ResourceSpans)
-    traces_data = trace_pb2.TracesData()
-    try:
-        traces_data.ParseFromString(data)
-    except Exception as e:
-        print(f"Error parsing as TracesData: {e}", file=sys.stderr)
-        return {"error": str(e), "spans": []}
 
-    all_spans = []
+def count_spans(traces_data: trace_pb2.TracesData) -> int:
+    """Count spans without decoding them."""
+    return sum(
+        len(scope_spans.spans)
+        for resource_spans in traces_data.resource_spans
+        for scope_spans in resource_spans.scope_spans
+    )
+
+
+def iter_spans(traces_data: trace_pb2.TracesData) -> Iterator[dict]:
+    """Yield decoded spans one at a time."""
     for resource_spans in traces_data.resource_spans:
-        resource_attrs = {}
-        if resource_spans.resource:
-            for attr in resource_spans.resource.attributes:
-                resource_attrs[attr.key] = decode_value(attr.value)
+        resource_attrs = decode_resource(resource_spans.resource.SerializeToString())
 
         for scope_spans in resource_spans.scope_spans:
-            scope_name = scope_spans.scope.name if scope_spans.scope else "unknown"
+            scope_name = intern_str(scope_spans.scope.name) if scope_spans.scope else "unknown"
 
             for span in scope_spans.spans:
                 span_info = extract_span_info(span)
                 span_info["resource"] = resource_attrs
                 span_info["scope"] = scope_name
-                all_spans.append(span_info)
+                yield span_info
+
+
+def _read_varint(buf: Union[bytes, mmap.mmap], pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 64:
+            raise ValueError("Malformed varint")
+
+
+def _iter_len_fields(buf: Union[bytes, mmap.mmap], start: int, end: int) -> Iterator[tuple[int, int, int]]:
+    """Yield (field_number, start, end) for length-delimited fields in buf[start:end]."""
+    pos = start
+    while pos < end:
+        tag, pos = _read_varint(buf, pos)
+        field_number, wire_type = tag >> 3, tag & 0x07
+        if wire_type == 0:
+            _, pos = _read_varint(buf, pos)
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 2:
+            length, pos = _read_varint(buf, pos)
+            if pos + length > end:
+                raise ValueError("Truncated length-delimited field")
+            yield field_number, pos, pos + length
+            pos += length
+        elif wire_type == 5:
+            pos += 4
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type}")
+
+
+def iter_candidate_spans(data: Union[bytes, mmap.mmap], needles: tuple[bytes, ...]) -> Iterator[dict]:
+    """Yield decoded spans whose raw bytes contain any needle, skipping full parse of the rest.
+
+    Walks the TracesData wire format (resource_spans=1 -> scope_spans=2 -> spans=2)
+    and only parses Span sub-messages that pass a bytes.find prescan.
+    """
+    load_protobuf()
+    for rs_field, rs_start, rs_end in _iter_len_fields(data, 0, len(data)):
+        if rs_field != 1:
+            continue
+        resource_range = None
+        scope_ranges = []
+        for field, start, end in _iter_len_fields(data, rs_start, rs_end):
+            if field == 1:
+                resource_range = (start, end)
+            elif field == 2:
+                scope_ranges.append((start, end))
+
+        resource_attrs = None
+        for ss_start, ss_end in scope_ranges:
+            scope_name = None
+            for field, start, end in _iter_len_fields(data, ss_start, ss_end):
+                if field == 1:
+                    scope_name = intern_str(common_pb2.InstrumentationScope.FromString(data[start:end]).name)
+                    continue
+                if field != 2:
+                    continue
+                if not any(data.find(needle, start, end) != -1 for needle in needles):
+                    continue
+                if resource_attrs is None:
+                    raw = data[resource_range[0]:resource_range[1]] if resource_range else b""
+                    resource_attrs = decode_resource(raw)
+                span_info = extract_span_info(trace_pb2.Span.FromString(data[start:end]))
+                span_info["resource"] = resource_attrs
+                span_info["scope"] = scope_name or ""
+                yield span_info
 
+
+def decode_trace_file(
+    filepath: Path,
+    traces_data: Optional[trace_pb2.TracesData] = None,
+) -> dict:
+    """Decode an OpenTelemetry trace protobuf file."""
+    # Try to parse as TracesData (collection of ResourceSpans)
+    try:
+        traces_data = load_traces_data(filepath, traces_data)
+    except Exception as e:
+        print(f"Error parsing as TracesData: {e}", file=sys.stderr)
+        return {"error": str(e), "spans": []}
+
+    all_spans = list(iter_spans(traces_data))
     return {
         "file": str(filepath),
         "total_spans": len(all_spans),
@@ -106,6 +304,33 @@ def decode_trace_file(filepath: Path) -> dict:
     }
 
 
+# Common LLM attribute keys; hit via a set probe before falling back to a prefix scan.
+_LLM_KEYS = frozenset({
+    "gen_ai.system",
+    "gen_ai.request.model",
+    "gen_ai.response.model",
+    "gen_ai.usage.prompt_tokens",
+    "gen_ai.usage.completion_tokens",
+    "gen_ai.usage.input_tokens",
+    "gen_ai.usage.output_tokens",
+    "llm.model_name",
+    "llm.system",
+    "llm.token_count.prompt",
+    "llm.token_count.completion",
+})
+_LLM_PREFIXES = ("gen_ai.", "llm.")
+
+
+def is_llm_span(attrs: dict) -> bool:
+    """Look for LLM spans (gen_ai.* or llm.* attributes)."""
+    if not _LLM_KEYS.isdisjoint(attrs):
+        return True
+    for k in attrs:
+        if k.startswith(_LLM_PREFIXES):
+            return True
+    return False
+
+
 def extract_llm_info(decoded_data: dict) -> list[dict]:
     """Extract LLM-related information from decoded spans."""
     llm_spans = []
@@ -113,8 +338,7 @@ def extract_llm_info(decoded_data: dict) -> list[dict]:
     for span in decoded_data.get("spans", []):
         attrs = span.get("attributes", {})
 
-        # Look for LLM spans (gen_ai.* or llm.* attributes)
-        if any(k.startswith(("gen_ai.", "llm.")) for k in attrs.keys()):
+        if is_llm_span(attrs):
             llm_info = {
                 "span_name": span["name"],
                 "span_id": span["span_id"],
@@ -160,46 +384,152 @@ def extract_tool_calls(decoded_data: dict) -> list[dict]:
     return tool_spans
 
 
+def summarize(spans: Iterable[dict]) -> dict:
+    """Compute summary counts in a single pass over decoded spans."""
+    total_spans = 0
+    llm_calls = 0
+    tool_calls = 0
+    names: dict[str, None] = {}  # ordered set: first-seen order keeps output reproducible
+    for span in spans:
+        name = span["name"]
+        total_spans += 1
+        if is_llm_span(span.get("attributes", {})):
+            llm_calls += 1
+        if name.startswith("tool."):
+            tool_calls += 1
+        names[name] = None
+    return {
+        "total_spans": total_spans,
+        "llm_calls": llm_calls,
+        "tool_calls": tool_calls,
+        "span_names": list(names)
+    }
+
+
+def dump_json(result, indent: bool = True) -> bytes:
+    """Serialize output as JSON bytes (orjson when available)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(result, option=option)
+    if indent:
+        return json.dumps(result, indent=2).encode("utf-8")
+    return json.dumps(result, separators=(",", ":")).encode("utf-8")
+
+
+def write_full_stream(out: BinaryIO, filepath: Path, traces_data: trace_pb2.TracesData) -> None:
+    """Write the --full document span by span; matches dump_json(decode_trace_file(...))."""
+    out.write(b'{\n  "file": ' + dump_json(str(filepath)))
+    out.write(b',\n  "total_spans": ' + str(count_spans(traces_data)).encode("ascii"))
+    out.write(b',\n  "spans": [')
+    sep = b"\n    "
+    for span_info in iter_spans(traces_data):
+        out.write(sep + dump_json(span_info).replace(b"\n", b"\n    "))
+        sep = b",\n    "
+    out.write(b"]\n}" if sep == b"\n    " else b"\n  ]\n}")
+
+
+def write_ndjson_stream(out: BinaryIO, traces_data: trace_pb2.TracesData) -> None:
+    """Write one compact JSON span per line."""
+    for span_info in iter_spans(traces_data):
+        out.write(dump_json(span_info, indent=False) + b"\n")
+
+
+def decode_result(filepath: Path, args: argparse.Namespace, traces_data: trace_pb2.TracesData) -> Any:
+    """Build the non-streaming (--prompts/--tools/summary) result for one file."""
+    if args.fast_filter and (args.prompts or args.tools):
+        needles = (b"gen_ai.", b"llm.") if args.prompts else (b"tool.",)
+        try:
+            with open_trace_bytes(filepath) as data:
+                spans = list(iter_candidate_spans(data, needles))
+        except Exception as e:
+            print(f"Error scanning TracesData: {e}", file=sys.stderr)
+            spans = []
+        decoded = {"file": str(filepath), "spans": spans}
+        return extract_llm_info(decoded) if args.prompts else extract_tool_calls(decoded)
+    if args.prompts:
+        return extract_llm_info(decode_trace_file(filepath, traces_data))
+    if args.tools:
+        return extract_tool_calls(decode_trace_file(filepath, traces_data))
+
+    # Summary by default
+    try:
+        load_traces_data(filepath, traces_data)
+    except Exception as e:
+        print(f"Error parsing as TracesData: {e}", file=sys.stderr)
+        return {"error": str(e), "spans": []}
+    return {"file": str(filepath), **summarize(iter_spans(traces_data))}
+
+
+def write_stream(out: BinaryIO, filepath: Path, args: argparse.Namespace, traces_data: trace_pb2.TracesData) -> None:
+    """Write --ndjson / --full output for one file."""
+    try:
+        load_traces_data(filepath, traces_data)
+    except Exception as e:
+        print(f"Error parsing as TracesData: {e}", file=sys.stderr)
+        out.write(dump_json({"error": str(e), "spans": []}, indent=not args.ndjson))
+        if args.ndjson:
+            out.write(b"\n")
+        return
+    if args.ndjson:
+        write_ndjson_stream(out, traces_data)
+    else:
+        write_full_stream(out, filepath, traces_data)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Decode OTel trace files from benchmarks")
-    parser.add_argument("trace_file", type=Path, help="Path to .pb trace file")
+    parser.add_argument("trace_files", type=Path, nargs="+", help="Path(s) to .pb trace file(s)")
     parser.add_argument("--output", "-o", type=Path, help="Output JSON file (default: stdout)")
     parser.add_argument("--prompts", action="store_true", help="Extract only LLM prompts")
     parser.add_argument("--full", action="store_true", help="Include full span details")
     parser.add_argument("--tools", action="store_true", help="Extract only tool calls")
+    parser.add_argument("--ndjson", action="store_true", help="Stream spans as newline-delimited JSON")
+    parser.add_argument(
+        "--fast-filter",
+        action="store_true",
+        help="With --prompts/--tools, prescan raw span bytes and only parse candidate spans",
+    )
 
     args = parser.parse_args()
 
-    if not args.trace_file.exists():
-        print(f"Error: File not found: {args.trace_file}", file=sys.stderr)
-        sys.exit(1)
-
-    print(f"Decoding {args.trace_file}...", file=sys.stderr)
-    decoded = decode_trace_file(args.trace_file)
+    for trace_file in args.trace_files:
+        if not trace_file.exists():
+            print(f"Error: File not found: {trace_file}", file=sys.stderr)
+            sys.exit(1)
 
-    if args.prompts:
-        result = extract_llm_info(decoded)
-    elif args.tools:
-        result = extract_tool_calls(decoded)
-    elif not args.full:
-        # Summary by default
-        result = {
-            "file": decoded["file"],
-            "total_spans": decoded["total_spans"],
-            "llm_calls": len(extract_llm_info(decoded)),
-            "tool_calls": len(extract_tool_calls(decoded)),
-            "span_names": list(set(s["name"] for s in decoded["spans"]))
-        }
-    else:
-        result = decoded
+    load_protobuf()
+    # One message reused (Clear + ParseFromString) across every input file.
+    traces_data = trace_pb2.TracesData()
+    streaming = (args.ndjson or args.full) and not (args.prompts or args.tools)
+    # Multiple inputs produce a JSON array of the per-file documents (NDJSON just concatenates).
+    as_array = len(args.trace_files) > 1 and not (streaming and args.ndjson)
 
-    output_json = json.dumps(result, indent=2)
+    out = args.output.open("wb") if args.output else sys.stdout.buffer
+    try:
+        if streaming:
+            if as_array:
+                out.write(b"[\n")
+            for idx, trace_file in enumerate(args.trace_files):
+                print(f"Decoding {trace_file}...", file=sys.stderr)
+                if as_array and idx:
+                    out.write(b",\n")
+                write_stream(out, trace_file, args, traces_data)
+            if as_array:
+                out.write(b"\n]")
+            if not args.ndjson:
+                out.write(b"\n")
+        else:
+            results = []
+            for trace_file in args.trace_files:
+                print(f"Decoding {trace_file}...", file=sys.stderr)
+                results.append(decode_result(trace_file, args, traces_data))
+            out.write(dump_json(results if as_array else results[0]) + b"\n")
+    finally:
+        if args.output:
+            out.close()
 
     if args.output:
-        args.output.write_text(output_json)
         print(f"Wrote output to {args.output}", file=sys.stderr)
-    else:
-        print(output_json)
 
 
 if __name__ == "__main__":
@@ -1,50 +1,116 @@
 #!/usr/bin/env python3
-"""Emit a single OTel log record to the OTLP collector."""
+"""Emit OTel log records to the OTLP collector.
+
+One record per invocation by default; with --stdin-jsonl, one record per JSON
+line on stdin ({"message", "level", "service", "endpoint", "attrs"}), reusing
+the exporter across records until EOF.
+"""
 from __future__ import annotations
 
 import argparse
+import json
 import logging
 import os
+import sys
+from typing import Any
+
+
+def resolve_service_name(service: str | None) -> str:
+    return (
+        service
+        or os.environ.get("BOTS_OTEL_SERVICE_NAME")
+        or os.environ.get("OTEL_SERVICE_NAME")
+        or "bots-runner"
+    )
 
-from opentelemetry._logs import set_logger_provider
-from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
-from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
-from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
-from opentelemetry.sdk.resources import Resource
+
+def resolve_endpoint(endpoint: str | None) -> str:
+    endpoint = endpoint or os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT_GRPC", "http://localhost:4317")
+    return endpoint.removeprefix("https://").removeprefix("http://")
+
+
+def make_handler(service_name: str, endpoint: str) -> tuple[Any, logging.Handler]:
+    """Build a (LoggerProvider, LoggingHandler) pair exporting to endpoint."""
+    # Deferred so --help and argument errors skip the SDK/gRPC import chain.
+    from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
+    from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
+    from opentelemetry.sdk._logs.export import SimpleLogRecordProcessor
+    from opentelemetry.sdk.resources import Resource
+
+    provider = LoggerProvider(resource=Resource.create({"service.name": service_name}))
+    # Records are exported synchronously; a batch processor would only add a
+    # worker thread, queue, and shutdown flush barrier.
+    provider.add_log_record_processor(SimpleLogRecordProcessor(OTLPLogExporter(endpoint=endpoint, insecure=True)))
+    return provider, LoggingHandler(level=logging.NOTSET, logger_provider=provider)
+
+
+def emit(handler: logging.Handler, service_name: str, message: str, level_name: str, attrs: dict[str, str]) -> None:
+    level = getattr(logging, level_name.upper(), logging.INFO)
+    # handler.handle() bypasses the logger's level check; keep the INFO
+    # threshold the logger has always applied.
+    if level < logging.INFO:
+        return
+    attr_pairs = " ".join(f"{key}={value}" for key, value in attrs.items())
+    message = f"{message} {attr_pairs}".strip()
+    logger = logging.getLogger(service_name)
+    handler.handle(logger.makeRecord(service_name, level, "(log_event)", 0, message, None, None, extra=attrs))
+
+
+def run_stdin_jsonl() -> None:
+    """Emit one record per JSON line on stdin; one exporter per (service, endpoint)."""
+    handlers: dict[tuple[str, str], tuple[Any, logging.Handler]] = {}
+    try:
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+                service_name = resolve_service_name(event.get("service"))
+                endpoint = resolve_endpoint(event.get("endpoint"))
+                attrs = {str(key): str(value) for key, value in (event.get("attrs") or {}).items()}
+                key = (service_name, endpoint)
+                if key not in handlers:
+                    handlers[key] = make_handler(service_name, endpoint)
+                emit(handlers[key][1], service_name, str(event.get("message") or ""), str(event.get("level") or "info"), attrs)
+            except Exception as exc:
+                # One bad frame or failed export must not stop the stream.
+                print(f"log_event: dropped record: {exc}", file=sys.stderr)
+    finally:
+        for provider, _ in handlers.values():
+            provider.shutdown()
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Emit a single OTel log record.")
-    parser.add_argument("message", help="Log message")
+    parser = argparse.ArgumentParser(description="Emit OTel log records.")
+    parser.add_argument("message", nargs="?", help="Log message")
     parser.add_argument("--level", default="info", help="Log level (info, warning, error)")
     parser.add_argument("--service", default=None, help="Service name (default: BOTS_OTEL_SERVICE_NAME or OTEL_SERVICE_NAME)")
     parser.add_argument("--endpoint", default=None, help="OTLP gRPC endpoint (default: OTEL_EXPORTER_OTLP_ENDPOINT_GRPC)")
     parser.add_argument("--attr", action="append", default=[], help="Key=Value attribute (repeatable)")
-    args = parser.parse_args()
-
-    service_name = (
-        args.service
-        or os.environ.get("BOTS_OTEL_SERVICE_NAME")
-        or os.environ.get("OTEL_SERVICE_NAME")
-        or "bots-runner"
+    parser.add_argument(
+        "--stdin-jsonl",
+        action="store_true",
+        help="Read one JSON record per line from stdin until EOF instead of emitting a single message",
     )
-    endpoint = args.endpoint or os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT_GRPC", "http://localhost:4317")
-    endpoint = endpoint.replace("http://", "").replace("https://", "")
+    args = parser.parse_args()
 
-    resource = Resource.create({"service.name": service_name})
-    provider = LoggerProvider(resource=resource)
-    provider.add_log_record_processor(BatchLogRecordProcessor(OTLPLogExporter(endpoint=endpoint, insecure=True)))
-    set_logger_provider(provider)
+    if args.stdin_jsonl:
+        run_stdin_jsonl()
+        return
+    if args.message is None:
+        parser.error("message is required unless --stdin-jsonl is given")
 
-    logger = logging.getLogger(service_name)
-    logger.setLevel(logging.INFO)
-    logger.addHandler(LoggingHandler(level=logging.NOTSET, logger_provider=provider))
+    attrs: dict[str, str] = {}
+    for item in args.attr:
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            parser.error(f"--attr expects Key=Value, got: {item!r}")
+        attrs[key] = value
 
-    attrs = {k: v for k, _, v in (item.partition("=") for item in args.attr)}
-    level = getattr(logging, args.level.upper(), logging.INFO)
-    attr_pairs = " ".join(f"{key}={value}" for key, value in attrs.items())
-    message = f"{args.message} {attr_pairs}".strip()
-    logger.log(level, message, extra=attrs)
+    service_name = resolve_service_name(args.service)
+    provider, handler = make_handler(service_name, resolve_endpoint(args.endpoint))
+    emit(handler, service_name, args.message, args.level, attrs)
     provider.shutdown()
 
 
@@ -2,28 +2,106 @@
 """Small Tempo helpers for local OTel traces."""
 from __future__ import annotations
 
-import argparse
+import array
 import base64
 import datetime as dt
+import functools
+import heapq
 import json
+import operator
 import os
 import re
-import urllib.error
+import sys
+import threading
+import time
 import urllib.parse
-import urllib.request
-from typing import Any, Dict, Iterable, List, Optional
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    import argparse
+
+# The HTTP client stack (http.client/urllib.request pull in email, ssl, ...),
+# concurrent.futures and gzip are imported where they are used, so --help,
+# argument errors and disk-cache hits never pay for them. argparse is only
+# imported by build_parser(); handler args are any attribute namespace.
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Backend responses can be multi-MB; parse them with orjson when it is installed.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def dump_json(obj: Any, indent: bool = True) -> bytes:
+    """Serialize JSON output as bytes (orjson when available, json as the fallback)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib encoder handles them
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+_SINCE_RE = re.compile(r"^(\d+)([smhd])$")
+_HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+_UUID_RE = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+_NS_PER_S = 1_000_000_000
+_UTC = dt.timezone.utc
+
+
+@dataclass(frozen=True)
+class Config:
+    """Endpoint settings from the environment and .louie-ports."""
+
+    tempo_url: str
+    log_url: str
+    service_name: str
+    collector_url: str
+    api_base: Optional[str]
+    web_base: Optional[str]
+    trace_cache_dir: str
+    trace_cache_ttl: int
+    sessions_from_search: bool
+
+
+# Configuration does not change mid-command and sits on every Tempo/logs
+# request path, so it is resolved once per process on first use.
+@functools.lru_cache(maxsize=None)
+def config() -> Config:
+    env = os.environ
+    ports = load_louie_ports()
+    return Config(
+        tempo_url=env.get("OTEL_TEMPO_URL", "http://localhost:3200").rstrip("/"),
+        log_url=env.get("OTEL_LOG_URL", "http://localhost:3100").rstrip("/"),
+        service_name=env.get("OTEL_SERVICE_NAME", "py-louie"),
+        collector_url=env.get("OTEL_COLLECTOR_URL", "http://localhost:13133").rstrip("/"),
+        api_base=_default_api_base(env, ports),
+        web_base=_default_web_base(env, ports),
+        trace_cache_dir=os.path.expanduser(
+            env.get("OTEL_TRACE_CACHE_DIR") or "~/.cache/graphistry-trace-tools"
+        ),
+        trace_cache_ttl=parse_int_env("OTEL_TRACE_CACHE_TTL", 0),
+        sessions_from_search=parse_bool_env("OTEL_SESSIONS_FROM_SEARCH"),
+    )
 
 
 def tempo_url() -> str:
-    return os.environ.get("OTEL_TEMPO_URL", "http://localhost:3200").rstrip("/")
+    return config().tempo_url
 
 
 def log_url() -> str:
-    return os.environ.get("OTEL_LOG_URL", "http://localhost:3100").rstrip("/")
+    return config().log_url
 
 
 def default_service_name() -> str:
-    return os.environ.get("OTEL_SERVICE_NAME", "py-louie")
+    return config().service_name
 
 
 def default_query(service_name: str) -> str:
@@ -33,7 +111,7 @@ def default_query(service_name: str) -> str:
 def parse_since_to_seconds(value: str) -> int:
     if value.isdigit():
         return int(value)
-    match = re.match(r"^(\d+)([smhd])$", value)
+    match = _SINCE_RE.match(value)
     if not match:
         raise ValueError(f"Unsupported --since value: {value}")
     amount = int(match.group(1))
@@ -53,14 +131,25 @@ def parse_time_to_seconds(value: str) -> int:
     except ValueError as exc:
         raise ValueError(f"Unsupported time value: {value}") from exc
     if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=dt.timezone.utc)
+        parsed = parsed.replace(tzinfo=_UTC)
     return int(parsed.timestamp())
 
 
+@functools.lru_cache(maxsize=4096)
+def _iso_second(seconds: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
 def ns_to_iso(ns: int) -> str:
+    """Format epoch nanoseconds like datetime.isoformat() in UTC (microsecond precision)."""
     if not ns:
         return ""
-    return dt.datetime.fromtimestamp(ns / 1_000_000_000, tz=dt.timezone.utc).isoformat()
+    # Integer math avoids a datetime per log line/row, and log lines cluster within
+    # the same second, so the formatted date/time prefix is cached.
+    seconds, micros = divmod((ns + 500) // 1000, 1_000_000)
+    if micros:
+        return f"{_iso_second(seconds)}.{micros:06d}+00:00"
+    return f"{_iso_second(seconds)}+00:00"
 
 
 def resolve_time_range(
@@ -68,7 +157,7 @@ def resolve_time_range(
     start: Optional[str],
     end: Optional[str],
 ) -> tuple[int, int]:
-    now_s = int(dt.datetime.now(tz=dt.timezone.utc).timestamp())
+    now_s = int(dt.datetime.now(tz=_UTC).timestamp())
     end_s = parse_time_to_seconds(end) if end else now_s
     if start:
         start_s = parse_time_to_seconds(start)
@@ -77,24 +166,34 @@ def resolve_time_range(
     return start_s, end_s
 
 
-def add_time_range_args(
-    parser: argparse.ArgumentParser,
-    since_default: str,
-    since_help: str,
-    include_start_end: bool = True,
-) -> None:
-    parser.add_argument("--since", default=since_default, help=since_help)
-    if include_start_end:
-        parser.add_argument("--start", help="Start time")
-        parser.add_argument("--end", help="End time")
-
-
-def add_limit_arg(parser: argparse.ArgumentParser, default: int, help_text: str) -> None:
-    parser.add_argument("--limit", type=int, default=default, help=help_text)
+# Argument specs are (flags, add_argument kwargs) pairs; see _SUBCOMMAND_SPECS.
+ArgSpec = tuple[tuple[str, ...], Dict[str, Any]]
 
 
-def add_service_arg(parser: argparse.ArgumentParser, help_text: str) -> None:
-    parser.add_argument("--service", help=help_text)
+def common_specs(
+    since: Optional[tuple[str, str]] = None,
+    limit: Optional[tuple[int, str]] = None,
+    service: Optional[str] = None,
+    include_start_end: bool = True,
+) -> tuple[ArgSpec, ...]:
+    """Specs for the shared options, in a fixed order: --since [--start --end], --limit, --service.
+
+    since is (default, help), limit is (default, help) and service is the help text;
+    omitted options are not added.
+    """
+    specs: List[ArgSpec] = []
+    if since is not None:
+        since_default, since_help = since
+        specs.append((("--since",), {"default": since_default, "help": since_help}))
+        if include_start_end:
+            specs.append((("--start",), {"help": "Start time"}))
+            specs.append((("--end",), {"help": "End time"}))
+    if limit is not None:
+        limit_default, limit_help = limit
+        specs.append((("--limit",), {"type": int, "default": limit_default, "help": limit_help}))
+    if service is not None:
+        specs.append((("--service",), {"help": service}))
+    return tuple(specs)
 
 
 def parse_int_env(name: str, default: int) -> int:
@@ -121,27 +220,86 @@ def auto_log_headroom(max_bytes_config: int) -> int:
     return min(max_bytes_config, max(1024, min(16_384, one_percent)))
 
 
+_http_local = threading.local()
+
+
+def _uses_proxy(parts: urllib.parse.SplitResult) -> bool:
+    import urllib.request
+
+    proxies = urllib.request.getproxies()
+    return parts.scheme in proxies and not urllib.request.proxy_bypass(parts.hostname or "")
+
+
+def _http_get(url: str, timeout: float = 30) -> bytes:
+    """GET url over a per-thread keep-alive connection and return the body.
+
+    Tempo/logs lookups issue one search plus one request per trace against the
+    same host; reusing the connection skips a TCP (and TLS) handshake per call.
+    Falls back to urllib for proxies and redirects. Raises HTTPError on 4xx/5xx.
+    """
+    import http.client
+    import urllib.error
+    import urllib.request
+
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https") or _uses_proxy(parts):
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            return resp.read()
+
+    conns: Dict[tuple[str, str], http.client.HTTPConnection] = _http_local.__dict__.setdefault("conns", {})
+    key = (parts.scheme, parts.netloc)
+    path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    for attempt in range(2):
+        conn = conns.get(key)
+        reused = conn is not None
+        if conn is None:
+            conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            conn = conns[key] = conn_cls(parts.netloc, timeout=timeout)
+        try:
+            conn.request("GET", path)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (http.client.HTTPException, OSError) as exc:
+            conn.close()
+            conns.pop(key, None)
+            # Only retry when a kept-alive connection went stale (not on fresh failures or timeouts).
+            if not reused or attempt or isinstance(exc, TimeoutError):
+                raise
+            continue
+        if resp.will_close:
+            conn.close()
+            conns.pop(key, None)
+        if 300 <= resp.status < 400:
+            with urllib.request.urlopen(url, timeout=timeout) as redirected:
+                return redirected.read()
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        return body
+    raise RuntimeError(f"Failed to fetch {url}")
+
+
 def fetch_json(url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     if params:
         query = urllib.parse.urlencode(params)
         url = f"{url}?{query}"
-    req = urllib.request.Request(url)
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            payload = resp.read().decode("utf-8")
+        payload = _http_get(url)
     except Exception as exc:
         raise RuntimeError(f"Failed to fetch {url}: {exc}") from exc
+    # Parse the raw bytes; decoding to str first would copy the whole body again.
     try:
-        return json.loads(payload)
-    except json.JSONDecodeError as exc:
+        return _json_loads(payload)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise RuntimeError(f"Non-JSON response from {url}") from exc
 
 
 def collector_url() -> str:
-    return os.environ.get("OTEL_COLLECTOR_URL", "http://localhost:13133").rstrip("/")
+    return config().collector_url
 
 
+@functools.lru_cache(maxsize=None)
 def load_louie_ports(path: Optional[str] = None) -> Dict[str, str]:
+    """Parse .louie-ports (cached; callers must not mutate the returned dict)."""
     ports_path = path or os.path.join(os.getcwd(), ".louie-ports")
     if not os.path.exists(ports_path):
         return {}
@@ -166,46 +324,55 @@ def normalize_api_base(base: str) -> str:
     return trimmed
 
 
-def resolve_api_base(explicit: Optional[str]) -> Optional[str]:
-    if explicit:
-        return normalize_api_base(explicit)
-    env_url = os.environ.get("LOUIE_API_URL") or os.environ.get("LOUIE_API_BASE_URL")
+def _default_api_base(env: Any, ports: Dict[str, str]) -> Optional[str]:
+    env_url = env.get("LOUIE_API_URL") or env.get("LOUIE_API_BASE_URL")
     if env_url:
         return normalize_api_base(env_url)
-    ports = load_louie_ports()
     api_port = ports.get("LOUIE_API_PORT")
     if api_port:
         return f"http://localhost:{api_port}"
     base_url = ports.get("LOUIE_BASE_URL")
     if base_url:
         return normalize_api_base(base_url)
-    env_port = os.environ.get("LOUIE_API_PORT") or os.environ.get("DESKTOP_API_PORT")
+    env_port = env.get("LOUIE_API_PORT") or env.get("DESKTOP_API_PORT")
     if env_port:
-        host = os.environ.get("DESKTOP_API_HOST", "localhost")
+        host = env.get("DESKTOP_API_HOST", "localhost")
         return f"http://{host}:{env_port}"
     return None
 
 
-def resolve_web_base(explicit: Optional[str] = None) -> Optional[str]:
+def resolve_api_base(explicit: Optional[str]) -> Optional[str]:
     if explicit:
-        return explicit.rstrip("/")
-    env_url = os.environ.get("LOUIE_BASE_URL") or os.environ.get("LOUIE_WEB_URL")
+        return normalize_api_base(explicit)
+    return config().api_base
+
+
+def _default_web_base(env: Any, ports: Dict[str, str]) -> Optional[str]:
+    env_url = env.get("LOUIE_BASE_URL") or env.get("LOUIE_WEB_URL")
     if env_url:
         return env_url.rstrip("/")
-    ports = load_louie_ports()
     base_url = ports.get("LOUIE_BASE_URL")
     if base_url:
         return base_url.rstrip("/")
-    web_port = ports.get("LOUIE_WEB_PORT") or os.environ.get("LOUIE_WEB_PORT") or os.environ.get("DESKTOP_WEB_PORT")
+    web_port = ports.get("LOUIE_WEB_PORT") or env.get("LOUIE_WEB_PORT") or env.get("DESKTOP_WEB_PORT")
     if web_port:
         return f"http://localhost:{web_port}"
     return None
 
 
+def resolve_web_base(explicit: Optional[str] = None) -> Optional[str]:
+    if explicit:
+        return explicit.rstrip("/")
+    return config().web_base
+
+
 def check_http(
     url: str,
     headers: Optional[Dict[str, str]] = None,
 ) -> tuple[bool, int, str, Optional[str]]:
+    import urllib.error
+    import urllib.request
+
     req = urllib.request.Request(url, headers=headers or {})
     try:
         with urllib.request.urlopen(req, timeout=15) as resp:
@@ -223,6 +390,9 @@ def post_json(
     payload: Optional[Dict[str, Any]] = None,
     headers: Optional[Dict[str, str]] = None,
 ) -> tuple[bool, int, str, Optional[str]]:
+    import urllib.error
+    import urllib.request
+
     body = json.dumps(payload or {}).encode("utf-8")
     req_headers = {"Content-Type": "application/json"}
     if headers:
@@ -242,7 +412,8 @@ def post_json(
 def normalize_span_id(span_id: str) -> tuple[str, Optional[str]]:
     """Normalize span ID to hex if the input is base64."""
     raw = span_id.strip()
-    if re.fullmatch(r"[0-9a-fA-F]{16}", raw):
+    # int(raw, 16) would also accept "0x", "_" and sign prefixes, so check the charset instead.
+    if len(raw) == 16 and _HEX_CHARS.issuperset(raw):
         return raw.lower(), None
     try:
         padded = raw + "=" * ((4 - (len(raw) % 4)) % 4)
@@ -261,58 +432,113 @@ def parse_kv_pairs(message: str) -> Dict[str, str]:
         return data
     data["event"] = parts[0]
     for part in parts[1:]:
-        if "=" not in part:
-            continue
-        key, value = part.split("=", 1)
-        data[key] = value
+        key, sep, value = part.partition("=")
+        if sep:
+            data[key] = value
     return data
 
 
+def normalize_qid(qid_raw: str) -> str:
+    return qid_raw if qid_raw.startswith("Q") else f"Q{qid_raw}"
+
+
+def _qid_sort_key(qid: str) -> tuple[int, Any]:
+    # Numeric ids first in numeric order, then the rest by name; the tag keeps
+    # int and str keys from ever being compared with each other.
+    suffix = qid[1:]
+    return (0, int(suffix)) if suffix.isdigit() else (1, qid)
+
+
+def is_hex_trace_id(value: str) -> bool:
+    # Set containment rather than bytes.fromhex, which would also accept spaces.
+    return len(value) == 32 and _HEX_CHARS.issuperset(value)
+
+
 def is_uuid(value: str) -> bool:
-    return re.fullmatch(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}", value) is not None
+    return _UUID_RE.fullmatch(value) is not None
+
+
+@dataclass
+class Span:
+    """One span flattened from Tempo trace JSON."""
+
+    __slots__ = ("span_id", "parent_id", "name", "start_ns", "end_ns", "duration_ms", "status", "attrs", "events")
+
+    span_id: str
+    parent_id: str
+    name: str
+    start_ns: int
+    end_ns: int
+    duration_ms: float
+    status: Dict[str, Any]
+    attrs: Dict[str, Any]
+    events: List[Dict[str, Any]]
 
 
-def span_status_label(span: Dict[str, Any]) -> str:
-    status = span.get("status", {}) or {}
+_ERROR_STATUS_CODES = frozenset(("2", "error", "status_code_error"))
+_span_start = operator.attrgetter("start_ns")
+_log_ts = operator.itemgetter("ts_ns")
+
+
+def is_error_span(span: Span) -> bool:
+    if span.attrs.get("error"):
+        return True
+    status = span.status
+    if not status:
+        return False
     code = status.get("code") or status.get("statusCode")
-    attrs = span.get("attrs", {}) or {}
-    if attrs.get("error") or str(code).lower() in ("2", "error", "status_code_error"):
-        return "x"
-    return "✓"
+    return str(code).lower() in _ERROR_STATUS_CODES
+
+
+def span_status_label(span: Span) -> str:
+    return "x" if is_error_span(span) else "✓"
+
+
+def _int_or_raw(raw: Any) -> Any:
+    try:
+        return int(raw)
+    except Exception:
+        return raw
+
+
+def _float_or_raw(raw: Any) -> Any:
+    try:
+        return float(raw)
+    except Exception:
+        return raw
+
+
+_ATTR_DECODERS = {
+    "stringValue": lambda raw: raw,
+    "intValue": _int_or_raw,
+    "doubleValue": _float_or_raw,
+    "boolValue": bool,
+    "arrayValue": lambda raw: [attr_value(item.get("value")) for item in (raw or {}).get("values", [])],
+    "kvlistValue": lambda raw: {
+        item.get("key"): attr_value(item.get("value"))
+        for item in (raw or {}).get("values", [])
+    },
+}
 
 
 def attr_value(value: Any) -> Any:
     if not isinstance(value, dict):
         return value
-    if "stringValue" in value:
-        return value["stringValue"]
-    if "intValue" in value:
-        try:
-            return int(value["intValue"])
-        except Exception:
-            return value["intValue"]
-    if "doubleValue" in value:
-        try:
-            return float(value["doubleValue"])
-        except Exception:
-            return value["doubleValue"]
-    if "boolValue" in value:
-        return bool(value["boolValue"])
-    if "arrayValue" in value:
-        return [
-            attr_value(item.get("value"))
-            for item in value.get("arrayValue", {}).get("values", [])
-        ]
-    if "kvlistValue" in value:
-        return {
-            item.get("key"): attr_value(item.get("value"))
-            for item in value.get("kvlistValue", {}).get("values", [])
-        }
+    # OTLP JSON AnyValue carries exactly one type key, so dispatch on it directly.
+    for key in value:
+        decoder = _ATTR_DECODERS.get(key)
+        if decoder is not None:
+            return decoder(value[key])
     return value
 
 
-def collect_spans(trace: Dict[str, Any]) -> List[Dict[str, Any]]:
-    spans: List[Dict[str, Any]] = []
+def decode_attrs(attributes: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    return {attr.get("key"): attr_value(attr.get("value")) for attr in attributes or []}
+
+
+def collect_spans(trace: Dict[str, Any], include_attrs: bool = True) -> List[Span]:
+    """Flatten Tempo trace JSON into Span records; include_attrs=False leaves attrs empty."""
+    spans: List[Span] = []
     for batch in trace.get("batches", []) or []:
         batch_spans = batch.get("spans")
         if batch_spans is None:
@@ -320,51 +546,74 @@ def collect_spans(trace: Dict[str, Any]) -> List[Dict[str, Any]]:
             for scope_span in batch.get("scopeSpans", []) or []:
                 batch_spans.extend(scope_span.get("spans", []) or [])
         for span in batch_spans:
-            attrs = {
-                attr.get("key"): attr_value(attr.get("value"))
-                for attr in span.get("attributes", []) or []
-            }
+            attrs = decode_attrs(span.get("attributes")) if include_attrs else {}
             start_ns = int(span.get("startTimeUnixNano") or 0)
             end_ns = int(span.get("endTimeUnixNano") or 0)
             duration_ms = (end_ns - start_ns) / 1_000_000 if start_ns and end_ns else 0.0
-            spans.append({
-                "span_id": span.get("spanId", ""),
-                "parent_id": span.get("parentSpanId", ""),
-                "name": span.get("name", ""),
-                "start_ns": start_ns,
-                "end_ns": end_ns,
-                "duration_ms": duration_ms,
-                "status": span.get("status", {}),
-                "attrs": attrs,
-                "events": span.get("events", []) or [],
-            })
+            spans.append(Span(
+                span_id=span.get("spanId", ""),
+                parent_id=span.get("parentSpanId", ""),
+                name=span.get("name", ""),
+                start_ns=start_ns,
+                end_ns=end_ns,
+                duration_ms=duration_ms,
+                status=span.get("status", {}),
+                attrs=attrs,
+                events=span.get("events", []) or [],
+            ))
     return spans
 
 
-def root_spans(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    span_ids = {span["span_id"] for span in spans}
-    roots: List[Dict[str, Any]] = []
-    for span in spans:
-        parent_id = span.get("parent_id") or ""
-        if not parent_id or parent_id not in span_ids or parent_id == "0000000000000000":
-            roots.append(span)
-    return sorted(roots, key=lambda s: s["start_ns"])
+class SpanIndex:
+    """Spans of one trace sorted by start time, indexed by id and parent once."""
 
+    def __init__(self, spans: List[Span]) -> None:
+        self.spans = sorted(spans, key=_span_start)
+        self.span_ids = {span.span_id for span in self.spans}
+        # Buckets are filled in global start order, so each is already sorted.
+        self.children: Dict[str, List[Span]] = {}
+        for span in self.spans:
+            self.children.setdefault(span.parent_id or "", []).append(span)
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def __iter__(self):
+        return iter(self.spans)
+
+    def roots(self) -> List[Span]:
+        roots: List[Span] = []
+        for span in self.spans:
+            parent_id = span.parent_id or ""
+            if not parent_id or parent_id not in self.span_ids or parent_id == "0000000000000000":
+                roots.append(span)
+        return roots
+
+    def walk(self) -> Iterable[tuple[int, Span]]:
+        """Yield (depth, span) in depth-first pre-order, children by start time."""
+        children = self.children
+        # Explicit stack instead of nested generators: no per-level frames and
+        # no recursion limit on deep traces. Push reversed to pop in order.
+        stack = [(0, root) for root in reversed(self.roots())]
+        while stack:
+            depth, span = stack.pop()
+            yield depth, span
+            kids = children.get(span.span_id)
+            if kids:
+                depth += 1
+                stack.extend((depth, child) for child in reversed(kids))
+
+
+def _span_index(spans: Any) -> SpanIndex:
+    return spans if isinstance(spans, SpanIndex) else SpanIndex(spans)
 
-def iter_span_tree(spans: List[Dict[str, Any]]) -> Iterable[tuple[int, Dict[str, Any]]]:
-    children: Dict[str, List[Dict[str, Any]]] = {}
-    for span in spans:
-        children.setdefault(span.get("parent_id") or "", []).append(span)
-    for kids in children.values():
-        kids.sort(key=lambda s: s["start_ns"])
 
-    def walk(span: Dict[str, Any], depth: int) -> Iterable[tuple[int, Dict[str, Any]]]:
-        yield depth, span
-        for child in children.get(span["span_id"], []):
-            yield from walk(child, depth + 1)
+def root_spans(spans: List[Span]) -> List[Span]:
+    return _span_index(spans).roots()
 
-    for root in root_spans(spans):
-        yield from walk(root, 0)
+
+def iter_span_tree(spans: List[Span]) -> Iterable[tuple[int, Span]]:
+    return _span_index(spans).walk()
 
 
 def list_traces(args: argparse.Namespace) -> None:
@@ -395,34 +644,126 @@ def list_traces(args: argparse.Namespace) -> None:
         print(f"{trace_id}\t{duration_ms}\t{root_service}\t{root_name}\t{start_time}")
 
 
+def _trace_cache_path(trace_id: str) -> Optional[str]:
+    cfg = config()
+    # Only plain hex IDs map to cache files; anything else bypasses the disk cache.
+    if cfg.trace_cache_ttl <= 0 or not trace_id or not _HEX_CHARS.issuperset(trace_id):
+        return None
+    return os.path.join(cfg.trace_cache_dir, f"{trace_id.lower()}.json.gz")
+
+
+def _read_trace_cache(path: str) -> Optional[Dict[str, Any]]:
+    import gzip
+    import zlib
+
+    try:
+        if time.time() - os.path.getmtime(path) > config().trace_cache_ttl:
+            return None
+        with gzip.open(path, "rb") as handle:
+            return _json_loads(handle.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, EOFError, zlib.error):
+        # Truncated or corrupt entry: drop it so the caller refetches from Tempo.
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+
+def _write_trace_cache(path: str, trace: Dict[str, Any]) -> None:
+    import gzip
+
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with gzip.open(tmp_path, "wb", compresslevel=1) as handle:
+            handle.write(dump_json(trace, indent=False))
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+# Traces are fetched repeatedly within one command (sessions, then their runs);
+# OTEL_TRACE_CACHE_TTL additionally persists them across invocations.
+@functools.lru_cache(maxsize=512)
 def get_trace(trace_id: str) -> Dict[str, Any]:
-    return fetch_json(f"{tempo_url()}/api/traces/{trace_id}")
+    """Fetch a trace from Tempo (cached; callers must not mutate the result)."""
+    cache_path = _trace_cache_path(trace_id)
+    if cache_path:
+        cached = _read_trace_cache(cache_path)
+        if cached is not None:
+            return cached
+    trace = fetch_json(f"{tempo_url()}/api/traces/{trace_id}")
+    if cache_path:
+        _write_trace_cache(cache_path, trace)
+    return trace
+
+
+def fetch_traces(trace_ids: List[str], max_workers: int = 8) -> Iterable[tuple[str, Dict[str, Any]]]:
+    """Fetch traces concurrently, yielding (trace_id, trace) in input order.
+
+    Traces that fail to fetch are skipped, matching the per-trace try/except in callers.
+    """
+    import concurrent.futures
+
+    def _fetch(trace_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return get_trace(trace_id)
+        except Exception:
+            return None
+
+    if not trace_ids:
+        return
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(trace_ids))) as pool:
+        for trace_id, trace in zip(trace_ids, pool.map(_fetch, trace_ids)):
+            if trace is not None:
+                yield trace_id, trace
 
 
-def span_name_matches(span: Dict[str, Any], match: Optional[str]) -> bool:
-    if not match:
-        return True
+@functools.lru_cache(maxsize=64)
+def _compile_match(pattern: str) -> Optional[re.Pattern[str]]:
+    """Compile a --match pattern once; None means invalid regex (substring match)."""
     try:
-        return re.search(match, span.get("name", "")) is not None
+        return re.compile(pattern)
     except re.error:
-        return match in span.get("name", "")
+        return None
+
 
-def trace_to_spans(args: argparse.Namespace) -> List[Dict[str, Any]]:
+def span_name_matches(name: str, match: Optional[str]) -> bool:
+    if not match:
+        return True
+    compiled = _compile_match(match)
+    if compiled is None:
+        return match in name
+    return compiled.search(name) is not None
+
+def trace_to_spans(args: argparse.Namespace, include_attrs: bool = True) -> SpanIndex:
     trace = get_trace(args.trace_id)
-    spans = collect_spans(trace)
-    spans.sort(key=lambda s: s["start_ns"])
-    return spans
+    return SpanIndex(collect_spans(trace, include_attrs=include_attrs))
+
+def write_lines(lines: List[str]) -> None:
+    """Emit a finished table in one write instead of a print() per row."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
 
 def trace2tree(args: argparse.Namespace) -> None:
-    spans = trace_to_spans(args)
+    spans = trace_to_spans(args, include_attrs=False)
     if not spans:
         print("No spans found.")
         return
+    lines: List[str] = []
     for depth, span in iter_span_tree(spans):
-        if not span_name_matches(span, args.match):
+        if not span_name_matches(span.name, args.match):
             continue
         indent = "  " * depth
-        print(f"{indent}{span.get('name')} [{span.get('duration_ms'):.2f}ms]")
+        lines.append(f"{indent}{span.name} [{span.duration_ms:.2f}ms]")
+    write_lines(lines)
 
 
 def trace2spans(args: argparse.Namespace) -> None:
@@ -430,38 +771,38 @@ def trace2spans(args: argparse.Namespace) -> None:
     if not spans:
         print("No spans found.")
         return
-    filtered = [s for s in spans if span_name_matches(s, getattr(args, "match", None))]
+    filtered = [s for s in spans if span_name_matches(s.name, getattr(args, "match", None))]
     if not filtered:
         print("No spans matched.")
         return
 
-    show_queue = any("queue_delay_ms" in (s.get("attrs") or {}) for s in filtered)
-    show_loop = any("event_loop_id" in (s.get("attrs") or {}) for s in filtered)
+    show_queue = any("queue_delay_ms" in s.attrs for s in filtered)
+    show_loop = any("event_loop_id" in s.attrs for s in filtered)
     headers = ["span_id", "parent_id", "duration_ms", "name", "status"]
     if show_queue:
         headers.append("queue_delay_ms")
     if show_loop:
         headers.append("event_loop_id")
-    print("\t".join(headers))
-
+    lines = ["\t".join(headers)]
     for span in filtered:
-        attrs = span.get("attrs", {}) or {}
+        attrs = span.attrs
         row = [
-            span.get("span_id", ""),
-            span.get("parent_id", ""),
-            f"{span.get('duration_ms', 0.0):.2f}",
-            span.get("name", ""),
+            span.span_id,
+            span.parent_id,
+            f"{span.duration_ms:.2f}",
+            span.name,
             span_status_label(span),
         ]
         if show_queue:
             row.append(str(attrs.get("queue_delay_ms", "")))
         if show_loop:
             row.append(str(attrs.get("event_loop_id", "")))
-        print("\t".join(row))
+        lines.append("\t".join(row))
+    write_lines(lines)
 
 
 def trace2events(args: argparse.Namespace) -> None:
-    spans = trace_to_spans(args)
+    spans = trace_to_spans(args, include_attrs=False)
     if not spans:
         print("No spans found.")
         return
@@ -470,22 +811,19 @@ def trace2events(args: argparse.Namespace) -> None:
     include_attrs = getattr(args, "attrs", False)
     print("timestamp\tspan\tlevel\tmessage")
     for span in spans:
-        if span_id and span.get("span_id") != span_id:
+        if span_id and span.span_id != span_id:
             continue
-        for event in span.get("events", []) or []:
+        for event in span.events:
             name = event.get("name", "")
-            if match and not span_name_matches({"name": name}, match):
+            if match and not span_name_matches(name, match):
                 continue
-            attrs = {
-                attr.get("key"): attr_value(attr.get("value"))
-                for attr in event.get("attributes", []) or []
-            }
+            attrs = decode_attrs(event.get("attributes"))
             level = attrs.get("level") or attrs.get("severity") or attrs.get("severity_text") or ""
             message = attrs.get("msg") or attrs.get("message") or name
             if include_attrs:
                 message = f"{message} {json.dumps(attrs, ensure_ascii=True)}"
             timestamp = ns_to_iso(int(event.get("timeUnixNano") or 0))
-            print(f"{timestamp}\t{span.get('name','')}\t{level}\t{message}")
+            print(f"{timestamp}\t{span.name}\t{level}\t{message}")
 
 
 def find_errors(args: argparse.Namespace) -> None:
@@ -495,15 +833,12 @@ def find_errors(args: argparse.Namespace) -> None:
         return
     headers = ["span_id", "duration_ms", "name", "status"]
     print("\t".join(headers))
+    match = getattr(args, "match", None)
+    # Status is the cheap test and rejects most spans; only then try the name pattern.
     for span in spans:
-        if not span_name_matches(span, getattr(args, "match", None)):
+        if not is_error_span(span) or not span_name_matches(span.name, match):
             continue
-        if span_status_label(span) != "x":
-            continue
-        print(
-            f"{span.get('span_id','')}\t{span.get('duration_ms',0.0):.2f}\t"
-            f"{span.get('name','')}\t{span_status_label(span)}"
-        )
+        print(f"{span.span_id}\t{span.duration_ms:.2f}\t{span.name}\tx")
 
 def _query_log_backend(
     query: str,
@@ -511,17 +846,14 @@ def _query_log_backend(
     start_ns: int,
     end_ns: int,
 ) -> tuple[List[Dict[str, Any]], Optional[str]]:
-    params = {
-        "query": query,
-        "limit": str(limit),
-        "start": str(start_ns),
-        "end": str(end_ns),
-    }
-    url = f"{log_url()}/loki/api/v1/query_range?{urllib.parse.urlencode(params)}"
+    # Only the LogQL query needs escaping; the other parameters are integers.
+    url = (
+        f"{log_url()}/loki/api/v1/query_range?query={urllib.parse.quote(query, safe='')}"
+        f"&limit={limit}&start={start_ns}&end={end_ns}"
+    )
 
     try:
-        with urllib.request.urlopen(url, timeout=30) as resp:
-            data = json.load(resp)
+        data = _json_loads(_http_get(url))
     except Exception as e:
         return [], f"Error querying logs backend: {e}"
 
@@ -533,20 +865,26 @@ def _query_log_backend(
 
 
 def collect_log_lines(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    all_logs: List[Dict[str, Any]] = []
+    streams: List[List[Dict[str, Any]]] = []
     for stream in results:
         labels = stream.get("stream", {})
         level = labels.get("severity_text", labels.get("detected_level", "INFO"))
+        lines: List[Dict[str, Any]] = []
         for ts_ns, message in stream.get("values", []):
             ts_ns_int = int(ts_ns)
-            all_logs.append({
+            lines.append({
                 "ts_ns": ts_ns_int,
                 "timestamp": ns_to_iso(ts_ns_int),
                 "level": level,
                 "message": message,
             })
-    all_logs.sort(key=lambda x: x["ts_ns"])
-    return all_logs
+        # Each stream arrives as one monotonic run (Loki defaults to newest-first),
+        # so this stable sort is linear; streams are then k-way merged.
+        lines.sort(key=_log_ts)
+        streams.append(lines)
+    if len(streams) == 1:
+        return streams[0]
+    return list(heapq.merge(*streams, key=_log_ts))
 
 
 def fetch_span_logs(
@@ -557,8 +895,8 @@ def fetch_span_logs(
     trace_id: Optional[str] = None,
     limit: int = 200,
 ) -> List[Dict[str, Any]]:
-    start_ns = start_s * int(1e9)
-    end_ns = end_s * int(1e9)
+    start_ns = start_s * _NS_PER_S
+    end_ns = end_s * _NS_PER_S
     span_hex, span_original = normalize_span_id(span_id)
     base_selector = f'{{service_name="{service}"}}'
     span_filters = [f'span_id="{span_hex}"', f'otelSpanID="{span_hex}"']
@@ -580,15 +918,85 @@ def fetch_span_logs(
     return []
 
 
+# Loki's default max_entries_limit_per_query; larger limits are rejected outright.
+_LOKI_MAX_ENTRIES = 5000
+
+
+def fetch_logs_for_spans(
+    span_ids: List[str],
+    service: str,
+    start_s: int,
+    end_s: int,
+    limit: int = 200,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch logs for many spans with batched queries, keyed by normalized hex span id.
+
+    Only streams labelled with span_id/otelSpanID are attributed; spans missing
+    from the result should fall back to fetch_span_logs. Loki's limit caps the
+    whole batch, so when a batch comes back full, spans that got fewer than
+    limit lines are re-queried on their own.
+    """
+    wanted = sorted({normalize_span_id(span_id)[0] for span_id in span_ids if span_id})
+    wanted = [span_id for span_id in wanted if len(span_id) == 16 and _HEX_CHARS.issuperset(span_id)]
+    if not wanted:
+        return {}
+    start_ns = start_s * _NS_PER_S
+    end_ns = end_s * _NS_PER_S
+    chunk_size = max(1, _LOKI_MAX_ENTRIES // max(1, limit))
+    logs_by_span: Dict[str, List[Dict[str, Any]]] = {}
+    for offset in range(0, len(wanted), chunk_size):
+        chunk = wanted[offset : offset + chunk_size]
+        pattern = "|".join(chunk)
+        query = f'{{service_name="{service}"}} | span_id=~"{pattern}" or otelSpanID=~"{pattern}"'
+        batch_limit = limit * len(chunk)
+        results, err = _query_log_backend(query, batch_limit, start_ns, end_ns)
+        if err:
+            # The chunk's spans are left out and fall back to per-span queries.
+            print(f"log query error: {err}", file=sys.stderr)
+            continue
+        streams_by_span: Dict[str, List[Dict[str, Any]]] = {}
+        chunk_set = set(chunk)
+        total = 0
+        for stream in results:
+            total += len(stream.get("values", []) or [])
+            labels = stream.get("stream", {}) or {}
+            span_id = (labels.get("span_id") or labels.get("otelSpanID") or "").lower()
+            if span_id in chunk_set:
+                streams_by_span.setdefault(span_id, []).append(stream)
+        for span_id, streams in streams_by_span.items():
+            logs_by_span[span_id] = collect_log_lines(streams)[-limit:]
+        if total >= batch_limit:
+            # A full batch may have dropped older lines of any span below its own limit.
+            for span_id in chunk:
+                if span_id in logs_by_span and len(logs_by_span[span_id]) < limit:
+                    logs_by_span[span_id] = fetch_span_logs(span_id, service, start_s, end_s, limit=limit)
+    return logs_by_span
+
+
 def trace2logs(args: argparse.Namespace) -> None:
     """Query the logs backend for logs correlated with a trace_id."""
-    trace_id = args.trace_id
-    limit = getattr(args, "limit", 100)
-    service = getattr(args, "service", None) or default_service_name()
-    span_id = getattr(args, "span", None)
-    full = getattr(args, "full", False)
     start_s, end_s = resolve_time_range(getattr(args, "since", "1h"), None, None)
+    show_trace_logs(
+        args.trace_id,
+        getattr(args, "service", None) or default_service_name(),
+        start_s,
+        end_s,
+        limit=getattr(args, "limit", 100),
+        span_id=getattr(args, "span", None),
+        full=getattr(args, "full", False),
+    )
+
 
+def show_trace_logs(
+    trace_id: str,
+    service: str,
+    start_s: int,
+    end_s: int,
+    limit: int = 100,
+    span_id: Optional[str] = None,
+    full: bool = False,
+) -> None:
+    """Print logs for a trace (span-scoped first when span_id is given)."""
     logs: List[Dict[str, Any]] = []
     last_error: Optional[str] = None
     if span_id:
@@ -597,8 +1005,8 @@ def trace2logs(args: argparse.Namespace) -> None:
             print("Span-scoped logs not found; falling back to trace-level logs")
 
     if not logs:
-        start_ns = start_s * int(1e9)
-        end_ns = end_s * int(1e9)
+        start_ns = start_s * _NS_PER_S
+        end_ns = end_s * _NS_PER_S
         base_selector = f'{{service_name="{service}"}}'
         for query in (
             f'{base_selector} | trace_id="{trace_id}"',
@@ -635,8 +1043,8 @@ def search_logs(args: argparse.Namespace) -> None:
         print("Missing --contains value")
         return
     start_s, end_s = resolve_time_range(args.since, args.start, args.end)
-    start_ns = start_s * int(1e9)
-    end_ns = end_s * int(1e9)
+    start_ns = start_s * _NS_PER_S
+    end_ns = end_s * _NS_PER_S
     query = f'{{service_name="{service}"}} |= "{args.contains}"'
     results, err = _query_log_backend(query, args.limit, start_ns, end_ns)
     logs = collect_log_lines(results)
@@ -664,18 +1072,15 @@ def _collect_session_runs(
     }
     data = fetch_json(f"{tempo_url()}/api/search", params=params)
     traces = data.get("traces", []) or []
+    trace_ids = [
+        trace_meta.get("traceID") or trace_meta.get("traceId") or trace_meta.get("trace_id") or ""
+        for trace_meta in traces
+    ]
     runs: List[Dict[str, Any]] = []
-    for trace_meta in traces:
-        trace_id = trace_meta.get("traceID") or trace_meta.get("traceId") or trace_meta.get("trace_id") or ""
-        if not trace_id:
-            continue
-        try:
-            trace = get_trace(trace_id)
-        except Exception:
-            continue
+    for trace_id, trace in fetch_traces([trace_id for trace_id in trace_ids if trace_id]):
         spans = collect_spans(trace)
         for span in spans:
-            attrs = span.get("attrs", {}) or {}
+            attrs = span.attrs
             span_session = attrs.get("session.id") or attrs.get("session_id")
             if span_session != session_id:
                 continue
@@ -683,7 +1088,7 @@ def _collect_session_runs(
                 "span": span,
                 "trace_id": trace_id,
             })
-    runs.sort(key=lambda r: r["span"].get("start_ns", 0))
+    runs.sort(key=lambda r: r["span"].start_ns)
     return runs
 
 
@@ -694,6 +1099,21 @@ def _collect_sessions(
     limit: int,
     query: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
+    spans: Optional[Iterable[Span]] = None
+    if query is None and config().sessions_from_search:
+        spans = _search_session_spans(start_s, end_s, service, limit)
+    if spans is None:
+        spans = _fetch_session_spans(start_s, end_s, service, limit, query)
+    return _aggregate_sessions(spans)
+
+
+def _fetch_session_spans(
+    start_s: int,
+    end_s: int,
+    service: str,
+    limit: int,
+    query: Optional[str],
+) -> Iterable[Span]:
     search_query = query or f'{{name="api_run" && resource.service.name="{service}"}}'
     params = {
         "q": search_query,
@@ -703,56 +1123,111 @@ def _collect_sessions(
     }
     data = fetch_json(f"{tempo_url()}/api/search", params=params)
     traces = data.get("traces", []) or []
-    sessions: Dict[str, Dict[str, Any]] = {}
+    trace_ids = [
+        trace_meta.get("traceID") or trace_meta.get("traceId") or trace_meta.get("trace_id") or ""
+        for trace_meta in traces
+    ]
+    for _, trace in fetch_traces([trace_id for trace_id in trace_ids if trace_id]):
+        yield from collect_spans(trace)
+
+
+def _search_session_spans(start_s: int, end_s: int, service: str, limit: int) -> Optional[List[Span]]:
+    """Read session fields from TraceQL select() results, without fetching full traces.
+
+    Only the api_run spans themselves are seen (not their children), and only the
+    dotted session.id attribute is matched. Returns None when the backend does not
+    return span sets, so the caller falls back to fetching traces.
+    """
+    query = (
+        f'{{name="api_run" && resource.service.name="{service}" && span.session.id != ""}}'
+        " | select(span.session.id, span.run.id, span.git.sha, span.git.dirty, status)"
+    )
+    params = {"q": query, "start": start_s, "end": end_s, "limit": limit, "spss": 100}
+    try:
+        data = fetch_json(f"{tempo_url()}/api/search", params=params)
+    except RuntimeError:
+        return None
+    traces = data.get("traces", []) or []
+    spans: List[Span] = []
     for trace_meta in traces:
-        trace_id = trace_meta.get("traceID") or trace_meta.get("traceId") or trace_meta.get("trace_id") or ""
-        if not trace_id:
-            continue
-        try:
-            trace = get_trace(trace_id)
-        except Exception:
+        span_sets = trace_meta.get("spanSets") or ([trace_meta["spanSet"]] if trace_meta.get("spanSet") else [])
+        for span_set in span_sets:
+            for raw in span_set.get("spans", []) or []:
+                attrs = decode_attrs(raw.get("attributes"))
+                start_ns = int(raw.get("startTimeUnixNano") or 0)
+                duration_ns = int(raw.get("durationNanos") or 0)
+                spans.append(Span(
+                    span_id=raw.get("spanID", ""),
+                    parent_id="",
+                    name=raw.get("name", "api_run"),
+                    start_ns=start_ns,
+                    end_ns=start_ns + duration_ns,
+                    duration_ms=duration_ns / 1_000_000,
+                    status={"code": attrs.pop("status", None)},
+                    attrs=attrs,
+                    events=[],
+                ))
+    if not spans:
+        return None
+    return spans
+
+
+@dataclass
+class SessionAgg:
+    """Running totals for one session while scanning spans."""
+
+    __slots__ = ("start_ns", "end_ns", "runs", "status", "git_sha", "git_dirty")
+
+    start_ns: int
+    end_ns: int
+    runs: set
+    status: str
+    git_sha: Any
+    git_dirty: Any
+
+
+def _aggregate_sessions(spans: Iterable[Span]) -> List[Dict[str, Any]]:
+    sessions: Dict[str, SessionAgg] = {}
+    for span in spans:
+        attrs = span.attrs
+        session_id = attrs.get("session.id") or attrs.get("session_id")
+        if not session_id:
             continue
-        spans = collect_spans(trace)
-        for span in spans:
-            attrs = span.get("attrs", {}) or {}
-            session_id = attrs.get("session.id") or attrs.get("session_id")
-            if not session_id:
-                continue
-            run_id = attrs.get("run.id") or attrs.get("run_id")
-            git_sha = attrs.get("git.sha") or attrs.get("git_sha")
-            git_dirty = attrs.get("git.dirty") or attrs.get("git_dirty")
-            entry = sessions.setdefault(session_id, {
-                "start_ns": span.get("start_ns", 0),
-                "end_ns": span.get("end_ns", 0),
-                "runs": set(),
-                "status": "✓",
-                "git_sha": git_sha or "-",
-                "git_dirty": git_dirty or "-",
-            })
-            entry["start_ns"] = min(entry["start_ns"], span.get("start_ns", 0) or entry["start_ns"])
-            entry["end_ns"] = max(entry["end_ns"], span.get("end_ns", 0))
-            if run_id:
-                entry["runs"].add(run_id)
-            if span_status_label(span) == "x":
-                entry["status"] = "x"
-            if git_sha and entry["git_sha"] == "-":
-                entry["git_sha"] = git_sha
-            if git_dirty and entry["git_dirty"] == "-":
-                entry["git_dirty"] = git_dirty
+        run_id = attrs.get("run.id") or attrs.get("run_id")
+        git_sha = attrs.get("git.sha") or attrs.get("git_sha")
+        git_dirty = attrs.get("git.dirty") or attrs.get("git_dirty")
+        agg = sessions.get(session_id)
+        if agg is None:
+            agg = sessions[session_id] = SessionAgg(
+                span.start_ns, span.end_ns, set(), "✓", git_sha or "-", git_dirty or "-"
+            )
+        start_ns = span.start_ns
+        if start_ns and start_ns < agg.start_ns:
+            agg.start_ns = start_ns
+        if span.end_ns > agg.end_ns:
+            agg.end_ns = span.end_ns
+        if run_id:
+            agg.runs.add(run_id)
+        if is_error_span(span):
+            agg.status = "x"
+        if git_sha and agg.git_sha == "-":
+            agg.git_sha = git_sha
+        if git_dirty and agg.git_dirty == "-":
+            agg.git_dirty = git_dirty
 
     rows = []
-    for session_id, entry in sessions.items():
-        start_ns = entry["start_ns"]
-        end_ns = entry["end_ns"]
-        duration_s = (end_ns - start_ns) / 1_000_000_000 if start_ns and end_ns else 0
+    for session_id, agg in sessions.items():
+        start_ns = agg.start_ns
+        end_ns = agg.end_ns
+        duration_s = (end_ns - start_ns) / _NS_PER_S if start_ns and end_ns else 0
         rows.append({
             "session_id": session_id,
             "time": ns_to_iso(start_ns),
             "duration_s": duration_s,
-            "runs": len(entry["runs"]),
-            "status": entry["status"],
-            "git_sha": entry["git_sha"],
-            "git_dirty": entry["git_dirty"],
+            "runs": len(agg.runs),
+            "status": agg.status,
+            "git_sha": agg.git_sha,
+            "git_dirty": agg.git_dirty,
             "start_ns": start_ns,
         })
     rows.sort(key=lambda r: r["time"], reverse=True)
@@ -786,10 +1261,10 @@ def session2runs(args: argparse.Namespace) -> None:
     print("turn\trun_id\tdthread_id\tduration_ms\tagent\tstatus\ttrace_id")
     for idx, item in enumerate(runs, 1):
         span = item["span"]
-        attrs = span.get("attrs", {}) or {}
+        attrs = span.attrs
         print(
             f"{idx}\t{attrs.get('run.id','')}\t{attrs.get('dthread.id','')}\t"
-            f"{span.get('duration_ms',0.0):.0f}\t{attrs.get('agent','')}\t"
+            f"{span.duration_ms:.0f}\t{attrs.get('agent','')}\t"
             f"{span_status_label(span)}\t{item['trace_id']}"
         )
 
@@ -820,12 +1295,27 @@ def _resolve_run_trace_for_dthread(
             continue
         spans = collect_spans(trace)
         for span in spans:
-            attrs = span.get("attrs", {}) or {}
+            attrs = span.attrs
             if attrs.get("dthread.id") == dthread_id:
                 run_id = attrs.get("run.id") or attrs.get("run_id") or ""
                 return run_id, trace_id
     return "", ""
 
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_run_trace_for_dthread_minutes(
+    dthread_id: str,
+    start_min: int,
+    end_min: int,
+    service: str,
+) -> tuple[str, str]:
+    return _resolve_run_trace_for_dthread(dthread_id, start_min * 60, (end_min + 1) * 60, service)
+
+
+def _resolve_run_trace_for_dthread_cached(dthread_id: str, start_s: int, end_s: int, service: str) -> tuple[str, str]:
+    """Memoized dthread lookup; the window is widened to whole minutes so nearby ranges share an entry."""
+    return _resolve_run_trace_for_dthread_minutes(dthread_id, start_s // 60, end_s // 60, service)
+
 def _resolve_runs_for_bots_run(
     bots_run_id: str,
     start_s: int,
@@ -855,7 +1345,7 @@ def _resolve_runs_for_bots_run(
         run_id = ""
         dthread_id = ""
         for span in spans:
-            attrs = span.get("attrs", {}) or {}
+            attrs = span.attrs
             if not run_id:
                 run_id = attrs.get("run.id") or attrs.get("run_id") or ""
             if not dthread_id:
@@ -868,11 +1358,11 @@ def _resolve_runs_for_bots_run(
             if run_id and dthread_id:
                 break
         for span in spans:
-            attrs = span.get("attrs", {}) or {}
+            attrs = span.attrs
             qid_raw = attrs.get("bots.question_id") or attrs.get("bots.qid") or ""
             if not qid_raw:
                 continue
-            qid = qid_raw if qid_raw.startswith("Q") else f"Q{qid_raw}"
+            qid = normalize_qid(qid_raw)
             entry = results.setdefault(qid, {})
             entry.setdefault("trace_id", trace_id)
             if run_id:
@@ -882,14 +1372,17 @@ def _resolve_runs_for_bots_run(
     return results
 
 def run_status(args: argparse.Namespace) -> None:
+    import concurrent.futures
+
     target = args.run_id
     start_s, end_s = resolve_time_range(args.since, args.start, args.end)
+    start_ns, end_ns = start_s * _NS_PER_S, end_s * _NS_PER_S
 
-    is_trace_id = len(target) == 32 and all(c in "0123456789abcdef" for c in target.lower())
+    is_trace_id = is_hex_trace_id(target)
     is_run_id = target.startswith("R_") or target.startswith("run_")
     if is_trace_id or is_run_id:
         print(f"=== Run {target} ===")
-        run_args = argparse.Namespace(
+        run_args = SimpleNamespace(
             run_id=target,
             since=args.since,
             start=args.start,
@@ -905,8 +1398,6 @@ def run_status(args: argparse.Namespace) -> None:
         return
 
     if args.logs:
-        start_ns = start_s * int(1e9)
-        end_ns = end_s * int(1e9)
         services = [("runner", args.runner_service), ("client", args.client_service)]
         for label, service in services:
             query = f'{{service_name="{service}"}} |= "bots.run_id={target}"'
@@ -926,15 +1417,23 @@ def run_status(args: argparse.Namespace) -> None:
     client_service = args.client_service
     runner_query = f'{{service_name="{runner_service}"}} |= "bots.run_id={target}"'
     client_query = f'{{service_name="{client_service}"}} |= "bots.run_id={target}"'
-    start_ns = start_s * int(1e9)
-    end_ns = end_s * int(1e9)
-    runner_results, _ = _query_log_backend(runner_query, args.limit, start_ns, end_ns)
-    client_results, _ = _query_log_backend(client_query, args.limit, start_ns, end_ns)
+    # The two log queries and the Tempo bots-run search are independent round trips.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+        runner_future = pool.submit(_query_log_backend, runner_query, args.limit, start_ns, end_ns)
+        client_future = pool.submit(_query_log_backend, client_query, args.limit, start_ns, end_ns)
+        hits_future = pool.submit(
+            _resolve_runs_for_bots_run, target, start_s, end_s, args.client_service, args.limit
+        )
+        runner_results, _ = runner_future.result()
+        client_results, _ = client_future.result()
     runner_logs = collect_log_lines(runner_results)
     client_logs = collect_log_lines(client_results)
 
     questions: Dict[str, Dict[str, Any]] = {}
+    # Substring prefilters skip tokenizing lines that cannot carry the event.
     for entry in runner_logs:
+        if "bots.question." not in entry["message"]:
+            continue
         data = parse_kv_pairs(entry["message"])
         event = data.get("event", "")
         if not event.startswith("bots.question."):
@@ -943,20 +1442,22 @@ def run_status(args: argparse.Namespace) -> None:
         qid_raw = data.get("bots.qid") or data.get("bots.question_id") or ""
         if not qid_raw:
             continue
-        qid = qid_raw if qid_raw.startswith("Q") else f"Q{qid_raw}"
+        qid = normalize_qid(qid_raw)
         qstate = questions.setdefault(qid, {})
         qstate["status"] = status
         if "duration_s" in data:
             qstate["duration_s"] = data["duration_s"]
 
     for entry in client_logs:
+        if "bots.add_cell.start" not in entry["message"]:
+            continue
         data = parse_kv_pairs(entry["message"])
         if data.get("event") != "bots.add_cell.start":
             continue
         qid_raw = data.get("bots.question_id") or data.get("bots.qid") or ""
         if not qid_raw:
             continue
-        qid = qid_raw if qid_raw.startswith("Q") else f"Q{qid_raw}"
+        qid = normalize_qid(qid_raw)
         dthread_id = data.get("bots.thread_id") or ""
         if not dthread_id:
             continue
@@ -965,8 +1466,8 @@ def run_status(args: argparse.Namespace) -> None:
             qstate["dthread_id"] = dthread_id
 
     service = default_service_name()
-    trace_hits = _resolve_runs_for_bots_run(target, start_s, end_s, args.client_service, args.limit)
-    trace_cache: Dict[str, tuple[str, str]] = {}
+    trace_hits = hits_future.result()
+    dthread_ids: Dict[str, None] = {}
     for qid, qstate in questions.items():
         if qid in trace_hits:
             hit = trace_hits[qid]
@@ -974,25 +1475,65 @@ def run_status(args: argparse.Namespace) -> None:
                 qstate["dthread_id"] = hit["dthread_id"]
             qstate.setdefault("run_id", hit.get("run_id", ""))
             qstate.setdefault("trace_id", hit.get("trace_id", ""))
+        if qstate.get("run_id") and qstate.get("trace_id"):
+            continue  # trace_hits already answered; no dthread lookup needed
         dthread_id = qstate.get("dthread_id")
-        if not dthread_id:
+        if dthread_id:
+            dthread_ids[dthread_id] = None
+
+    def resolve(dthread_id: str) -> tuple[str, str]:
+        return _resolve_run_trace_for_dthread_cached(dthread_id, start_s, end_s, service)
+
+    # Warm the memoized resolver for each distinct dthread concurrently; the
+    # assignment pass below then only hits the cache.
+    if dthread_ids:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(dthread_ids))) as pool:
+            list(pool.map(resolve, dthread_ids))
+    for qstate in questions.values():
+        dthread_id = qstate.get("dthread_id")
+        if not dthread_id or (qstate.get("run_id") and qstate.get("trace_id")):
             continue
-        if dthread_id not in trace_cache:
-            trace_cache[dthread_id] = _resolve_run_trace_for_dthread(dthread_id, start_s, end_s, service)
-        run_id, trace_id = trace_cache[dthread_id]
+        run_id, trace_id = resolve(dthread_id)
         qstate["run_id"] = run_id
         qstate["trace_id"] = trace_id
 
-    print("question\tstatus\tduration_s\tdthread_id\trun_id\ttrace_id")
-    for qid in sorted(questions.keys(), key=lambda v: int(v[1:]) if v[1:].isdigit() else v):
+    lines = ["question\tstatus\tduration_s\tdthread_id\trun_id\ttrace_id"]
+    for qid in sorted(questions, key=_qid_sort_key):
         qstate = questions[qid]
-        print(
+        lines.append(
             f"{qid}\t{qstate.get('status','')}\t{qstate.get('duration_s','')}\t"
             f"{qstate.get('dthread_id','')}\t{qstate.get('run_id','')}\t{qstate.get('trace_id','')}"
         )
+    write_lines(lines)
+
+@dataclass
+class StatusResult:
+    """One component row of the status report."""
+
+    __slots__ = ("component", "status", "url", "detail", "data")
+
+    component: str
+    status: str
+    url: str
+    detail: str
+    data: Optional[Dict[str, Any]]
+
+    def to_json(self) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {
+            "component": self.component,
+            "status": self.status,
+            "url": self.url,
+            "detail": self.detail,
+        }
+        if self.data:
+            entry["data"] = self.data
+        return entry
+
 
 def status(args: argparse.Namespace) -> None:
-    results: List[Dict[str, Any]] = []
+    import concurrent.futures
+
+    results: List[StatusResult] = []
 
     def add_result(
         component: str,
@@ -1013,18 +1554,24 @@ def status(args: argparse.Namespace) -> None:
             status_label = "error"
         else:
             status_label = "fail"
-        entry = {
-            "component": component,
-            "status": status_label,
-            "url": url or "-",
-            "detail": detail,
-        }
-        if data:
-            entry["data"] = data
-        results.append(entry)
+        results.append(StatusResult(component, status_label, url or "-", detail, data))
+
+    collector_arg = getattr(args, "collector", None)
+    collector_env = os.environ.get("OTEL_COLLECTOR_URL")
+    collector = collector_arg or collector_env or collector_url()
+    api_base = resolve_api_base(getattr(args, "api", None))
+    api_health = f"{api_base}/api/health" if api_base else None
+
+    # The health probes are independent; run them concurrently so the command takes
+    # the slowest probe's time rather than the sum. Results are still reported in order.
+    probe_urls = [f"{tempo_url()}/ready", f"{log_url()}/ready", collector]
+    if api_health:
+        probe_urls.append(api_health)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(probe_urls)) as pool:
+        probes = dict(zip(probe_urls, pool.map(check_http, probe_urls)))
 
     def optional_check(component: str, url: str, explicit: bool, missing_hint: str) -> None:
-        ok, code, reason, _ = check_http(url)
+        ok, code, reason, _ = probes[url]
         detail = f"{code} {reason}" if code else reason
         if ok or explicit:
             add_result(component, url, ok, code, detail)
@@ -1043,9 +1590,6 @@ def status(args: argparse.Namespace) -> None:
         os.environ.get("OTEL_LOG_URL") is not None,
         "not detected (logs backend optional; set OTEL_LOG_URL to check)",
     )
-    collector_arg = getattr(args, "collector", None)
-    collector_env = os.environ.get("OTEL_COLLECTOR_URL")
-    collector = collector_arg or collector_env or collector_url()
     optional_check(
         "collector",
         collector,
@@ -1089,14 +1633,12 @@ def status(args: argparse.Namespace) -> None:
         data=limit_data,
     )
 
-    api_base = resolve_api_base(getattr(args, "api", None))
     token = None
     if not api_base:
         add_result("api.health", "-", False, 0, "no API base (set --api or run from repo root)", status_override="skip")
         add_result("api.capabilities", "-", False, 0, "no API base (set --api or run from repo root)", status_override="skip")
     else:
-        api_health = f"{api_base}/api/health"
-        ok, code, reason, _ = check_http(api_health)
+        ok, code, reason, _ = probes[api_health]
         add_result("api.health", api_health, ok, code, f"{code} {reason}" if code else reason)
 
         token = (
@@ -1112,7 +1654,7 @@ def status(args: argparse.Namespace) -> None:
                 ok, code, reason, body = post_json(f"{web_base}/auth/anonymous")
                 if ok and body:
                     try:
-                        payload = json.loads(body)
+                        payload = _json_loads(body)
                     except json.JSONDecodeError:
                         payload = {}
                     token = payload.get("token")
@@ -1135,7 +1677,7 @@ def status(args: argparse.Namespace) -> None:
             detail = f"{code} {reason}" if code else reason
             if ok and body:
                 try:
-                    payload = json.loads(body)
+                    payload = _json_loads(body)
                 except json.JSONDecodeError:
                     detail = f"{detail} (non-JSON response)"
                 else:
@@ -1153,16 +1695,108 @@ def status(args: argparse.Namespace) -> None:
             add_result("api.capabilities", caps_url, ok, code, detail)
 
     if getattr(args, "json", False):
-        print(json.dumps(results, indent=2))
+        print(dump_json([result.to_json() for result in results]).decode("utf-8"))
     else:
-        print("component\tstatus\turl\tdetail")
-        for entry in results:
-            print(f"{entry['component']}\t{entry['status']}\t{entry['url']}\t{entry['detail']}")
+        write_lines(["component\tstatus\turl\tdetail"] + [
+            f"{result.component}\t{result.status}\t{result.url}\t{result.detail}"
+            for result in results
+        ])
 
         if not api_base:
             print("Hint: pass --api http://localhost:$LOUIE_API_PORT or run from repo root with .louie-ports")
 
 
+_LLM_ATTR_KEYS = frozenset((
+    "llm.model",
+    "model",
+    "prompt_tokens",
+    "completion_tokens",
+    "llm.model_name",
+    "llm.system",
+    "gen_ai.request.model",
+    "gen_ai.usage.input_tokens",
+    "openinference.span.kind",
+))
+_LLM_EVENT_NAMES = frozenset(("llm.prompt", "llm.response", "gen_ai.client.inference.operation.details"))
+# Fallback order matters: the first key present wins, even if its value is empty.
+_MODEL_KEYS = ("model", "llm.model", "llm.model_name", "gen_ai.request.model")
+_TOKENS_IN_KEYS = ("prompt_tokens", "tokens_in", "gen_ai.usage.input_tokens", "llm.token_count.prompt")
+_TOKENS_OUT_KEYS = ("completion_tokens", "tokens_out", "gen_ai.usage.output_tokens", "llm.token_count.completion")
+# Key order of the dicts returned by collect_llm_calls (also the --json field order).
+_LLM_CALL_FIELDS = (
+    "name",
+    "trace_id",
+    "span_id",
+    "start_ns",
+    "duration_ms",
+    "model",
+    "tokens_in",
+    "tokens_out",
+    "prompt_chars",
+    "completion_chars",
+    "prompt",
+    "response",
+    "input_sha256",
+    "output_sha256",
+    "input_bytes",
+    "output_bytes",
+    "input_truncated",
+    "output_truncated",
+)
+
+
+def _event_attr(attributes: Optional[List[Dict[str, Any]]], key: str, default: Any = None) -> Any:
+    """Decode a single key from a raw OTLP attribute list (last occurrence wins, as in decode_attrs)."""
+    for attr in reversed(attributes or []):
+        if attr.get("key") == key:
+            return attr_value(attr.get("value"))
+    return default
+
+
+def _first_attr(attrs: Dict[str, Any], keys: tuple[str, ...]) -> Any:
+    return next((attrs[key] for key in keys if key in attrs), "")
+
+
+def _format_messages(value: Any) -> str:
+    """Render OpenInference/gen_ai message payloads (JSON text or decoded) as [role] blocks."""
+    if value is None:
+        return ""
+    data: Any = value
+    if isinstance(data, str):
+        try:
+            data = _json_loads(data)
+        except Exception:
+            return data
+    if isinstance(data, dict):
+        data = [data]
+    if not isinstance(data, list):
+        return str(data)
+    lines: List[str] = []
+    for msg in data:
+        if not isinstance(msg, dict):
+            lines.append(str(msg))
+            continue
+        role = msg.get("role") or msg.get("message.role") or ""
+        parts = msg.get("parts")
+        content = ""
+        if isinstance(parts, list):
+            chunks: List[str] = []
+            for part in parts:
+                if isinstance(part, dict):
+                    for key in ("content", "result", "text"):
+                        if key in part and part[key]:
+                            chunks.append(str(part[key]))
+                            break
+                elif part is not None:
+                    chunks.append(str(part))
+            content = "\n".join(chunks)
+        if not content:
+            content = str(msg.get("content") or msg.get("message.content") or msg.get("text") or "")
+        prefix = f"[{role}]" if role else "[message]"
+        lines.append(f"{prefix}\n{content}".strip())
+    return "\n\n".join([line for line in lines if line])
+
+
 def collect_llm_calls(
     run_id: str,
     service: str,
@@ -1170,44 +1804,6 @@ def collect_llm_calls(
     end_s: int,
     include_prompts: bool,
 ) -> List[Dict[str, Any]]:
-    def _format_messages(value: Any) -> str:
-        if value is None:
-            return ""
-        data: Any = value
-        if isinstance(data, str):
-            try:
-                data = json.loads(data)
-            except Exception:
-                return data
-        if isinstance(data, dict):
-            data = [data]
-        if not isinstance(data, list):
-            return str(data)
-        lines: List[str] = []
-        for msg in data:
-            if not isinstance(msg, dict):
-                lines.append(str(msg))
-                continue
-            role = msg.get("role") or msg.get("message.role") or ""
-            parts = msg.get("parts")
-            content = ""
-            if isinstance(parts, list):
-                chunks: List[str] = []
-                for part in parts:
-                    if isinstance(part, dict):
-                        for key in ("content", "result", "text"):
-                            if key in part and part[key]:
-                                chunks.append(str(part[key]))
-                                break
-                    elif part is not None:
-                        chunks.append(str(part))
-                content = "\n".join(chunks)
-            if not content:
-                content = str(msg.get("content") or msg.get("message.content") or msg.get("text") or "")
-            prefix = f"[{role}]" if role else "[message]"
-            lines.append(f"{prefix}\n{content}".strip())
-        return "\n\n".join([line for line in lines if line])
-
     query = '{span.run.id = "%s" && resource.service.name="%s"}' % (run_id, service)
     params = {
         "q": query,
@@ -1218,88 +1814,77 @@ def collect_llm_calls(
     data = fetch_json(f"{tempo_url()}/api/search", params=params)
     traces = data.get("traces", []) or []
 
-    llm_calls: List[Dict[str, Any]] = []
-    for trace_meta in traces:
-        trace_id = trace_meta.get("traceID") or trace_meta.get("traceId") or ""
-        if not trace_id:
-            continue
-        try:
-            trace = get_trace(trace_id)
-        except Exception:
-            continue
+    trace_ids = [trace_meta.get("traceID") or trace_meta.get("traceId") or "" for trace_meta in traces]
 
+    # Collect rows column-aligned with _LLM_CALL_FIELDS and sort by a packed
+    # int64 start column; dicts are only built once, in final order.
+    rows: List[tuple] = []
+    starts = array.array("q")
+    for trace_id, trace in fetch_traces([trace_id for trace_id in trace_ids if trace_id], max_workers=16):
         spans = collect_spans(trace)
         for span in spans:
-            name = span.get("name", "")
+            name = span.name
             name_lower = name.lower()
-            attrs = span.get("attrs", {})
-            events = span.get("events", []) or []
-            has_llm_attrs = any(
-                key in attrs
-                for key in (
-                    "llm.model",
-                    "model",
-                    "prompt_tokens",
-                    "completion_tokens",
-                    "llm.model_name",
-                    "llm.system",
-                    "gen_ai.request.model",
-                    "gen_ai.usage.input_tokens",
-                    "openinference.span.kind",
-                )
-            )
-            has_llm_events = any(
-                event.get("name") in ("llm.prompt", "llm.response", "gen_ai.client.inference.operation.details")
-                for event in events
-            )
+            attrs = span.attrs
+            events = span.events
+            has_llm_attrs = not _LLM_ATTR_KEYS.isdisjoint(attrs)
+            has_llm_events = any(event.get("name") in _LLM_EVENT_NAMES for event in events)
             if "llm" in name_lower or "completion" in name_lower or has_llm_attrs or has_llm_events:
                 prompt_text = ""
                 response_text = ""
                 if include_prompts:
                     for event in events:
                         event_name = event.get("name", "")
-                        event_attrs = {
-                            a.get("key"): attr_value(a.get("value"))
-                            for a in event.get("attributes", []) or []
-                        }
+                        if event_name not in _LLM_EVENT_NAMES:
+                            continue
+                        event_attributes = event.get("attributes")
                         if event_name == "llm.prompt":
-                            prompt_text = str(event_attrs.get("msg", ""))[:500]
+                            prompt_text = str(_event_attr(event_attributes, "msg", ""))[:500]
                         elif event_name == "llm.response":
-                            response_text = str(event_attrs.get("msg", ""))[:500]
-                        elif event_name == "gen_ai.client.inference.operation.details":
-                            prompt_text = prompt_text or _format_messages(event_attrs.get("gen_ai.input.messages"))[:500]
-                            response_text = response_text or _format_messages(event_attrs.get("gen_ai.output.messages"))[:500]
+                            response_text = str(_event_attr(event_attributes, "msg", ""))[:500]
+                        else:
+                            if not prompt_text:
+                                prompt_text = _format_messages(
+                                    _event_attr(event_attributes, "gen_ai.input.messages")
+                                )[:500]
+                            if not response_text:
+                                response_text = _format_messages(
+                                    _event_attr(event_attributes, "gen_ai.output.messages")
+                                )[:500]
                     if not prompt_text:
                         prompt_text = _format_messages(attrs.get("input.value"))[:500]
                     if not response_text:
                         response_text = _format_messages(attrs.get("output.value"))[:500]
-                llm_calls.append({
-                    "name": name,
-                    "trace_id": trace_id,
-                    "span_id": span.get("span_id", ""),
-                    "start_ns": span.get("start_ns", 0),
-                    "duration_ms": span.get("duration_ms", 0),
-                    "model": attrs.get("model", attrs.get("llm.model", attrs.get("llm.model_name", attrs.get("gen_ai.request.model", "")))),
-                    "tokens_in": attrs.get("prompt_tokens", attrs.get("tokens_in", attrs.get("gen_ai.usage.input_tokens", attrs.get("llm.token_count.prompt", "")))),
-                    "tokens_out": attrs.get("completion_tokens", attrs.get("tokens_out", attrs.get("gen_ai.usage.output_tokens", attrs.get("llm.token_count.completion", "")))),
-                    "prompt_chars": attrs.get("prompt_chars", ""),
-                    "completion_chars": attrs.get("completion_chars", ""),
-                    "prompt": prompt_text,
-                    "response": response_text,
-                    "input_sha256": attrs.get("input.value_sha256", ""),
-                    "output_sha256": attrs.get("output.value_sha256", ""),
-                    "input_bytes": attrs.get("input.value_bytes", ""),
-                    "output_bytes": attrs.get("output.value_bytes", ""),
-                    "input_truncated": attrs.get("input.value_truncated", ""),
-                    "output_truncated": attrs.get("output.value_truncated", ""),
-                })
-
-    llm_calls.sort(key=lambda c: c["start_ns"])
-    return llm_calls
+                starts.append(span.start_ns)
+                rows.append((
+                    name,
+                    trace_id,
+                    span.span_id,
+                    span.start_ns,
+                    span.duration_ms,
+                    _first_attr(attrs, _MODEL_KEYS),
+                    _first_attr(attrs, _TOKENS_IN_KEYS),
+                    _first_attr(attrs, _TOKENS_OUT_KEYS),
+                    attrs.get("prompt_chars", ""),
+                    attrs.get("completion_chars", ""),
+                    prompt_text,
+                    response_text,
+                    attrs.get("input.value_sha256", ""),
+                    attrs.get("output.value_sha256", ""),
+                    attrs.get("input.value_bytes", ""),
+                    attrs.get("output.value_bytes", ""),
+                    attrs.get("input.value_truncated", ""),
+                    attrs.get("output.value_truncated", ""),
+                ))
+
+    order = sorted(range(len(starts)), key=starts.__getitem__)
+    return [dict(zip(_LLM_CALL_FIELDS, rows[i])) for i in order]
 
 
 def run2llm(args: argparse.Namespace) -> None:
     """Show LLM calls for a specific run."""
+    import concurrent.futures
+
     run_id = args.run_id
     service = args.service or default_service_name()
     start_s, end_s = resolve_time_range(args.since, args.start, args.end)
@@ -1321,13 +1906,20 @@ def run2llm(args: argparse.Namespace) -> None:
         return call["tokens_in"] or "-", call["tokens_out"] or "-"
 
     def _prompt_preview(text: str) -> str:
-        lines = text.split("\n")
-        content_lines = [
-            line for line in lines
-            if not line.startswith("[") or not line.endswith("]")
-        ]
-        base = (content_lines[0] if content_lines else lines[0]) if lines else ""
-        return base[:150]
+        # First line that is not a "[role]" marker (else the first line); scans
+        # line by line instead of splitting the whole prompt.
+        first = None
+        start = 0
+        while True:
+            end = text.find("\n", start)
+            line = text[start:] if end < 0 else text[start:end]
+            if first is None:
+                first = line
+            if not (line.startswith("[") and line.endswith("]")):
+                return line[:150]
+            if end < 0:
+                return first[:150]
+            start = end + 1
 
     def _print_header(call: Dict[str, Any], idx: int, include_span: bool) -> None:
         print(f"=== LLM Call #{idx}: {call['name']} ({call['duration_ms']:.0f}ms) ===")
@@ -1343,16 +1935,32 @@ def run2llm(args: argparse.Namespace) -> None:
         if call.get("response"):
             print(f"{response_label}: {call['response'].splitlines()[0][:150]}...")
 
+    # Same window trace2logs would use: --since back from now.
+    log_start_s, log_end_s = resolve_time_range(args.since, None, None)
+    batched_span_logs: Optional[Dict[str, List[Dict[str, Any]]]] = None
+
     def _print_span_logs(call: Dict[str, Any]) -> None:
+        nonlocal batched_span_logs
         print(f"=== Logs for Span {call['span_id']} ===")
-        trace2logs(argparse.Namespace(
-            trace_id=call["trace_id"],
+        if batched_span_logs is None:
+            # First use: one query for every displayed span instead of one per span.
+            batched_span_logs = fetch_logs_for_spans(
+                [c["span_id"] for c in display_calls], service, log_start_s, log_end_s, limit=50
+            )
+        logs = batched_span_logs.get(normalize_span_id(call["span_id"])[0])
+        if logs:
+            print_logs(logs, args.full)
+            print()
+            return
+        show_trace_logs(
+            call["trace_id"],
+            service,
+            log_start_s,
+            log_end_s,
             limit=50,
-            since=args.since,
-            service=service,
-            span=call["span_id"],
+            span_id=call["span_id"],
             full=args.full,
-        ))
+        )
         print()
 
     def _print_full_logs(call: Dict[str, Any]) -> bool:
@@ -1363,19 +1971,20 @@ def run2llm(args: argparse.Namespace) -> None:
             end_s,
             trace_id=call.get("trace_id"),
         )
-        llm_logs = [
-            log for log in logs
-            if "llm.prompt" in log["message"] or "llm.response" in log["message"]
-        ]
+        # Classify each line once; a message mentioning both counts as a prompt.
+        llm_logs: List[tuple[str, str]] = []
+        for log in logs:
+            message = log["message"]
+            if "llm.prompt" in message:
+                llm_logs.append(("PROMPT", message))
+            elif "llm.response" in message:
+                llm_logs.append(("RESPONSE", message))
         if not llm_logs:
             print("(no LLM logs found in logs backend)")
             print()
             return False
-        for log in llm_logs:
-            lines = log["message"].split("\n", 1)
-            header = lines[0] if lines else ""
-            content = lines[1] if len(lines) > 1 else ""
-            kind = "PROMPT" if "llm.prompt" in log["message"] else "RESPONSE"
+        for kind, message in llm_logs:
+            header, _, content = message.partition("\n")
             print(f"--- {kind} ({header}) ---")
             print(content[:10000] if content else "(empty)")
             print()
@@ -1390,16 +1999,24 @@ def run2llm(args: argparse.Namespace) -> None:
 
     if show_json:
         output: List[Dict[str, Any]] = []
-        for call in display_calls:
-            entry = dict(call)
-            if show_full:
-                logs = fetch_span_logs(
+        logs_by_call: List[List[Dict[str, Any]]] = []
+        if show_full and display_calls:
+            # Per-span log lookups are independent round-trips; fetch them concurrently.
+            def _fetch(call: Dict[str, Any]) -> List[Dict[str, Any]]:
+                return fetch_span_logs(
                     call["span_id"],
                     service,
                     start_s,
                     end_s,
                     trace_id=call.get("trace_id"),
                 )
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(display_calls))) as pool:
+                logs_by_call = list(pool.map(_fetch, display_calls))
+        for i, call in enumerate(display_calls):
+            entry = dict(call)
+            if show_full:
+                logs = logs_by_call[i]
                 prompt_text = ""
                 response_text = ""
                 for log in logs:
@@ -1412,7 +2029,7 @@ def run2llm(args: argparse.Namespace) -> None:
                 if response_text:
                     entry["response"] = response_text
             output.append(entry)
-        print(json.dumps(output, indent=2))
+        print(dump_json(output).decode("utf-8"))
         return
 
     if show_full:
@@ -1434,13 +2051,14 @@ def run2llm(args: argparse.Namespace) -> None:
             if show_logs:
                 _print_span_logs(call)
     else:
-        print("name\tduration_ms\tmodel\ttokens_in\ttokens_out\ttrace_id\tspan_id")
+        lines = ["name\tduration_ms\tmodel\ttokens_in\ttokens_out\ttrace_id\tspan_id"]
         for call in display_calls:
-            print(
+            lines.append(
                 f"{call['name']}\t{call['duration_ms']:.0f}\t{call['model']}\t"
                 f"{call['tokens_in'] or '-'}\t{call['tokens_out'] or '-'}\t"
                 f"{call['trace_id']}\t{call['span_id']}"
             )
+        write_lines(lines)
         if show_logs:
             for call in display_calls:
                 _print_span_logs(call)
@@ -1459,7 +2077,7 @@ def inspect(args: argparse.Namespace) -> None:
             return
         target = rows[0]["session_id"]
         print(f"=== Session {target} ===")
-        session2runs(argparse.Namespace(
+        session2runs(SimpleNamespace(
             session_id=target,
             since=args.since,
             start=None,
@@ -1470,7 +2088,7 @@ def inspect(args: argparse.Namespace) -> None:
         return
 
     if getattr(args, "sessions", False):
-        list_sessions(argparse.Namespace(
+        list_sessions(SimpleNamespace(
             since=args.since,
             start=None,
             end=None,
@@ -1496,14 +2114,14 @@ def inspect(args: argparse.Namespace) -> None:
 
     if not target:
         print("=== Recent Traces ===")
-        list_traces(argparse.Namespace(
+        list_traces(SimpleNamespace(
             since=args.since, start=None, end=None, limit=5, query=None, service=svc
         ))
         print("Usage: inspect <trace_id|run_id|session_id|bots_run_id> [--prompts|--full|--logs|--errors]")
         return
 
     # Trace IDs are hex strings, run IDs have R_ prefix
-    is_trace_id = len(target) == 32 and all(c in '0123456789abcdef' for c in target.lower())
+    is_trace_id = is_hex_trace_id(target)
     is_run_id = target.startswith("R_") or target.startswith("run_")
     is_session_id = is_uuid(target)
     is_bots_run = target.startswith("bots_")
@@ -1512,12 +2130,13 @@ def inspect(args: argparse.Namespace) -> None:
         # It's a trace ID - show trace tree
         print(f"=== Trace {target} ===")
         if getattr(args, "errors", False):
-            find_errors(argparse.Namespace(trace_id=target, match=args.match))
+            find_errors(SimpleNamespace(trace_id=target, match=args.match))
             return
-        trace_args = argparse.Namespace(trace_id=target, match=args.match)
+        trace_args = SimpleNamespace(trace_id=target, match=args.match)
         trace2tree(trace_args)
         if getattr(args, "logs", False):
-            trace2logs(argparse.Namespace(trace_id=target, limit=50, since=args.since))
+            log_start_s, log_end_s = resolve_time_range(args.since, None, None)
+            show_trace_logs(target, default_service_name(), log_start_s, log_end_s, limit=50)
         print("Hint: bin/otel/cmds/trace2tree | bin/otel/cmds/trace2logs")
         return
 
@@ -1533,9 +2152,9 @@ def inspect(args: argparse.Namespace) -> None:
                 return
             for trace_id in trace_ids:
                 print(f"--- Errors for trace {trace_id} ---")
-                find_errors(argparse.Namespace(trace_id=trace_id, match=args.match))
+                find_errors(SimpleNamespace(trace_id=trace_id, match=args.match))
             return
-        run_args = argparse.Namespace(
+        run_args = SimpleNamespace(
             run_id=target, since=args.since, start=None, end=None,
             service=svc, prompts=args.prompts, full=args.full, logs=args.logs, json=False
         )
@@ -1549,7 +2168,7 @@ def inspect(args: argparse.Namespace) -> None:
             runs = _collect_session_runs(target, start_s, end_s, svc, getattr(args, "limit", 200))
             error_runs = [
                 item for item in runs
-                if span_status_label(item.get("span", {})) == "x"
+                if is_error_span(item["span"])
             ]
             if not error_runs:
                 print("No error runs found.")
@@ -1557,15 +2176,15 @@ def inspect(args: argparse.Namespace) -> None:
             print("turn\trun_id\tdthread_id\tduration_ms\tagent\tstatus\ttrace_id")
             for idx, item in enumerate(error_runs, 1):
                 span = item["span"]
-                attrs = span.get("attrs", {}) or {}
+                attrs = span.attrs
                 print(
                     f"{idx}\t{attrs.get('run.id','')}\t{attrs.get('dthread.id','')}\t"
-                    f"{span.get('duration_ms',0.0):.0f}\t{attrs.get('agent','')}\t"
+                    f"{span.duration_ms:.0f}\t{attrs.get('agent','')}\t"
                     f"{span_status_label(span)}\t{item['trace_id']}"
                 )
             print("Hint: bin/otel/cmds/find-errors <trace_id> for details")
             return
-        session2runs(argparse.Namespace(
+        session2runs(SimpleNamespace(
             session_id=target,
             since=args.since,
             start=None,
@@ -1577,7 +2196,7 @@ def inspect(args: argparse.Namespace) -> None:
 
     if is_bots_run:
         print(f"=== Bots Run {target} ===")
-        run_status(argparse.Namespace(
+        run_status(SimpleNamespace(
             run_id=target,
             since=args.since,
             start=None,
@@ -1595,128 +2214,169 @@ def inspect(args: argparse.Namespace) -> None:
 
 
 
-def build_parser() -> argparse.ArgumentParser:
+_MATCH_SPEC: ArgSpec = (("--match",), {"help": "Regex or substring to filter span names"})
+_TRACE_ID_SPEC: ArgSpec = (("trace_id",), {"help": "Trace ID"})
+
+# Subcommand -> (handler, help, argument specs), in help order. Built once at
+# import; build_parser() only walks the specs of the subcommand being invoked.
+_SUBCOMMAND_SPECS: Dict[str, tuple[Any, str, tuple[ArgSpec, ...]]] = {
+    "inspect": (inspect, "Smart inspector for trace/run IDs", (
+        (("target",), {"nargs": "?", "help": "Trace or run ID"}),
+        *common_specs(
+            since=("1h", "Lookback window"),
+            limit=(200, "Max sessions to scan"),
+            service="Service name",
+            include_start_end=False,
+        ),
+        (("--match",), {"help": "Filter span names (for trace IDs)"}),
+        (("--prompts",), {"action": "store_true", "help": "Show prompt/response (for run IDs)"}),
+        (("--full",), {"action": "store_true", "help": "Show full prompt/response (from logs backend)"}),
+        (("--logs",), {"action": "store_true", "help": "Show correlated logs (from logs backend)"}),
+        (("--errors",), {"action": "store_true", "help": "Show error spans or filter sessions"}),
+        (("--latest",), {"action": "store_true", "help": "Show latest session summary"}),
+        (("--sessions",), {"action": "store_true", "help": "List recent sessions"}),
+    )),
+    "status": (status, "Check OTel stack and API configuration", (
+        (("--api",), {"help": "API base URL (default: .louie-ports or LOUIE_API_URL)"}),
+        (("--token",), {"help": "Bearer token for /api/capabilities"}),
+        (("--collector",), {"help": "OTel collector health URL"}),
+        (("--json",), {"action": "store_true", "help": "Emit JSON output"}),
+    )),
+    "run2llm": (run2llm, "Show LLM calls for a run", (
+        (("run_id",), {"help": "Run ID"}),
+        *common_specs(since=("1h", "Lookback window"), service="Service name"),
+        (("--prompts",), {"action": "store_true", "help": "Show prompt/response preview (from Tempo)"}),
+        (("--full",), {"action": "store_true", "help": "Show full prompt/response (from logs backend)"}),
+        (("--logs",), {"action": "store_true", "help": "Show correlated logs for each span"}),
+        (("--json",), {"action": "store_true", "help": "Emit JSON output"}),
+        (("--index",), {"type": int, "help": "Select LLM call by 1-based index"}),
+    )),
+    "run-status": (run_status, "Show summary for a bots run id", (
+        (("run_id",), {"help": "Bots run ID (e.g., bots_20260114_164601)"}),
+        *common_specs(since=("30m", "Lookback window"), limit=(200, "Max log lines to scan per service")),
+        (("--runner-service",), {"default": "bots-runner", "help": "Service name for runner logs"}),
+        (("--client-service",), {"default": "bots-client", "help": "Service name for client logs"}),
+        (("--full",), {"action": "store_true", "help": "Do not truncate log messages"}),
+        (("--logs",), {"action": "store_true", "help": "Show raw logs instead of summary"}),
+    )),
+    # Trace-centric tools
+    "list-traces": (list_traces, "List recent traces", (
+        *common_specs(since=("15m", "Lookback window (e.g., 15m, 2h, 900)"), include_start_end=False),
+        (("--start",), {"help": "Start time (epoch seconds or ISO)"}),
+        (("--end",), {"help": "End time (epoch seconds or ISO)"}),
+        *common_specs(limit=(20, "Max traces to return"), service="Service name for default query"),
+        (("--query",), {"help": "TraceQL query"}),
+    )),
+    "list-sessions": (list_sessions, "List recent sessions", (
+        *common_specs(
+            since=("30m", "Lookback window"),
+            limit=(200, "Max sessions to scan"),
+            service="Service name for default query",
+        ),
+        (("--query",), {"help": "TraceQL query (defaults to api_run)"}),
+    )),
+    "session2runs": (session2runs, "List runs for a session id", (
+        (("session_id",), {"help": "Session ID"}),
+        *common_specs(
+            since=("2h", "Lookback window"),
+            limit=(200, "Max traces to scan"),
+            service="Service name for default query",
+        ),
+    )),
+    "trace2tree": (trace2tree, "Print trace as a tree", (_TRACE_ID_SPEC, _MATCH_SPEC)),
+    "trace2spans": (trace2spans, "Print trace spans as table", (_TRACE_ID_SPEC, _MATCH_SPEC)),
+    "trace2events": (trace2events, "Print span events", (
+        _TRACE_ID_SPEC,
+        (("--span",), {"help": "Span ID to filter events"}),
+        (("--event",), {"help": "Event name filter (regex or substring)"}),
+        (("--attrs",), {"action": "store_true", "help": "Include event attributes in output"}),
+    )),
+    "trace2logs": (trace2logs, "Query logs backend by trace_id", (
+        _TRACE_ID_SPEC,
+        *common_specs(
+            since=("1h", "Lookback window (e.g., 1h, 30m)"),
+            limit=(100, "Max log lines"),
+            service="Service name (default: OTEL_SERVICE_NAME)",
+            include_start_end=False,
+        ),
+        (("--span",), {"help": "Span ID to filter logs"}),
+        (("--full",), {"action": "store_true", "help": "Do not truncate log messages (escape newlines)"}),
+    )),
+    "find-errors": (find_errors, "List error spans in a trace", (_TRACE_ID_SPEC, _MATCH_SPEC)),
+    "search-logs": (search_logs, "Search logs backend by text", (
+        *common_specs(
+            since=("1h", "Lookback window"),
+            limit=(200, "Max log lines"),
+            service="Service name (default: OTEL_SERVICE_NAME)",
+        ),
+        (("--contains",), {"required": True, "help": "Substring to match in logs"}),
+        (("--full",), {"action": "store_true", "help": "Do not truncate log messages"}),
+    )),
+}
+
+
+def _add_subparser(subparsers: Any, name: str) -> None:
+    handler, help_text, specs = _SUBCOMMAND_SPECS[name]
+    parser = subparsers.add_parser(name, help=help_text)
+    parser.set_defaults(func=handler)
+    add_argument = parser.add_argument
+    for flags, kwargs in specs:
+        add_argument(*flags, **kwargs)
+
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named on the command line, or None.
+
+    The top-level parser has no options besides -h, so a subcommand can only be
+    argv[0]; `-h trace2tree` must still build (and list) every subcommand.
+    """
+    return argv[0] if argv and not argv[0].startswith("-") else None
+
+
+def build_parser(only: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser; with a known `only`, just that subcommand's parser is added."""
+    import argparse
+
     parser = argparse.ArgumentParser(description="Tempo helper scripts")
     subparsers = parser.add_subparsers(dest="cmd", required=True)
+    if only in _SUBCOMMAND_SPECS:
+        _add_subparser(subparsers, only)
+    else:
+        # --help, a missing command or an unknown one: build everything so the
+        # usage text and "invalid choice" errors list every subcommand.
+        for name in _SUBCOMMAND_SPECS:
+            _add_subparser(subparsers, name)
+    return parser
 
-    # Smart inspector
-    inspect_parser = subparsers.add_parser("inspect", help="Smart inspector for trace/run IDs")
-    inspect_parser.add_argument("target", nargs="?", help="Trace or run ID")
-    add_time_range_args(inspect_parser, "1h", "Lookback window", include_start_end=False)
-    add_service_arg(inspect_parser, "Service name")
-    inspect_parser.add_argument("--match", help="Filter span names (for trace IDs)")
-    inspect_parser.add_argument("--prompts", action="store_true", help="Show prompt/response (for run IDs)")
-    inspect_parser.add_argument("--full", action="store_true", help="Show full prompt/response (from logs backend)")
-    inspect_parser.add_argument("--logs", action="store_true", help="Show correlated logs (from logs backend)")
-    inspect_parser.add_argument("--errors", action="store_true", help="Show error spans or filter sessions")
-    inspect_parser.add_argument("--latest", action="store_true", help="Show latest session summary")
-    inspect_parser.add_argument("--sessions", action="store_true", help="List recent sessions")
-    add_limit_arg(inspect_parser, 200, "Max sessions to scan")
-    status_parser = subparsers.add_parser("status", help="Check OTel stack and API configuration")
-    status_parser.add_argument("--api", help="API base URL (default: .louie-ports or LOUIE_API_URL)")
-    status_parser.add_argument("--token", help="Bearer token for /api/capabilities")
-    status_parser.add_argument("--collector", help="OTel collector health URL")
-    status_parser.add_argument("--json", action="store_true", help="Emit JSON output")
-
-    r2l_parser = subparsers.add_parser("run2llm", help="Show LLM calls for a run")
-    r2l_parser.add_argument("run_id", help="Run ID")
-    add_time_range_args(r2l_parser, "1h", "Lookback window")
-    add_service_arg(r2l_parser, "Service name")
-    r2l_parser.add_argument("--prompts", action="store_true", help="Show prompt/response preview (from Tempo)")
-    r2l_parser.add_argument("--full", action="store_true", help="Show full prompt/response (from logs backend)")
-    r2l_parser.add_argument("--logs", action="store_true", help="Show correlated logs for each span")
-    r2l_parser.add_argument("--json", action="store_true", help="Emit JSON output")
-    r2l_parser.add_argument("--index", type=int, help="Select LLM call by 1-based index")
-
-    run_status_parser = subparsers.add_parser("run-status", help="Show summary for a bots run id")
-    run_status_parser.add_argument("run_id", help="Bots run ID (e.g., bots_20260114_164601)")
-    add_time_range_args(run_status_parser, "30m", "Lookback window")
-    add_limit_arg(run_status_parser, 200, "Max log lines to scan per service")
-    run_status_parser.add_argument("--runner-service", default="bots-runner", help="Service name for runner logs")
-    run_status_parser.add_argument("--client-service", default="bots-client", help="Service name for client logs")
-    run_status_parser.add_argument("--full", action="store_true", help="Do not truncate log messages")
-    run_status_parser.add_argument("--logs", action="store_true", help="Show raw logs instead of summary")
-
-    # Trace-centric tools (existing)
-    list_parser = subparsers.add_parser("list-traces", help="List recent traces")
-    add_time_range_args(list_parser, "15m", "Lookback window (e.g., 15m, 2h, 900)", include_start_end=False)
-    list_parser.add_argument("--start", help="Start time (epoch seconds or ISO)")
-    list_parser.add_argument("--end", help="End time (epoch seconds or ISO)")
-    add_limit_arg(list_parser, 20, "Max traces to return")
-    list_parser.add_argument("--query", help="TraceQL query")
-    add_service_arg(list_parser, "Service name for default query")
-
-    sessions_parser = subparsers.add_parser("list-sessions", help="List recent sessions")
-    add_time_range_args(sessions_parser, "30m", "Lookback window")
-    add_limit_arg(sessions_parser, 200, "Max sessions to scan")
-    add_service_arg(sessions_parser, "Service name for default query")
-    sessions_parser.add_argument("--query", help="TraceQL query (defaults to api_run)")
-
-    session_runs_parser = subparsers.add_parser("session2runs", help="List runs for a session id")
-    session_runs_parser.add_argument("session_id", help="Session ID")
-    add_time_range_args(session_runs_parser, "2h", "Lookback window")
-    add_limit_arg(session_runs_parser, 200, "Max traces to scan")
-    add_service_arg(session_runs_parser, "Service name for default query")
-
-    tree_parser = subparsers.add_parser("trace2tree", help="Print trace as a tree")
-    tree_parser.add_argument("trace_id", help="Trace ID")
-    tree_parser.add_argument("--match", help="Regex or substring to filter span names")
-
-    spans_parser = subparsers.add_parser("trace2spans", help="Print trace spans as table")
-    spans_parser.add_argument("trace_id", help="Trace ID")
-    spans_parser.add_argument("--match", help="Regex or substring to filter span names")
-
-    events_parser = subparsers.add_parser("trace2events", help="Print span events")
-    events_parser.add_argument("trace_id", help="Trace ID")
-    events_parser.add_argument("--span", help="Span ID to filter events")
-    events_parser.add_argument("--event", help="Event name filter (regex or substring)")
-    events_parser.add_argument("--attrs", action="store_true", help="Include event attributes in output")
-
-    logs_parser = subparsers.add_parser("trace2logs", help="Query logs backend by trace_id")
-    logs_parser.add_argument("trace_id", help="Trace ID")
-    add_limit_arg(logs_parser, 100, "Max log lines")
-    add_time_range_args(logs_parser, "1h", "Lookback window (e.g., 1h, 30m)", include_start_end=False)
-    add_service_arg(logs_parser, "Service name (default: OTEL_SERVICE_NAME)")
-    logs_parser.add_argument("--span", help="Span ID to filter logs")
-    logs_parser.add_argument("--full", action="store_true", help="Do not truncate log messages (escape newlines)")
-
-    errors_parser = subparsers.add_parser("find-errors", help="List error spans in a trace")
-    errors_parser.add_argument("trace_id", help="Trace ID")
-    errors_parser.add_argument("--match", help="Regex or substring to filter span names")
-
-    search_parser = subparsers.add_parser("search-logs", help="Search logs backend by text")
-    add_service_arg(search_parser, "Service name (default: OTEL_SERVICE_NAME)")
-    add_time_range_args(search_parser, "1h", "Lookback window")
-    add_limit_arg(search_parser, 200, "Max log lines")
-    search_parser.add_argument("--contains", required=True, help="Substring to match in logs")
-    search_parser.add_argument("--full", action="store_true", help="Do not truncate log messages")
 
-    return parser
+def _spec_default(flags: tuple[str, ...], kwargs: Dict[str, Any]) -> tuple[str, Any]:
+    dest = kwargs.get("dest") or flags[0].lstrip("-").replace("-", "_")
+    if "default" in kwargs:
+        return dest, kwargs["default"]
+    return dest, False if kwargs.get("action") == "store_true" else None
+
+
+def _simple_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse the common `<cmd> <id>` shape straight from the spec table, without argparse.
+
+    Returns None (use the full parser) unless argv is exactly a known subcommand
+    taking one positional plus a value that is not an option.
+    """
+    if len(argv) != 2 or argv[1].startswith("-") or argv[0] not in _SUBCOMMAND_SPECS:
+        return None
+    handler, _, specs = _SUBCOMMAND_SPECS[argv[0]]
+    positionals = [flags[0] for flags, _ in specs if not flags[0].startswith("-")]
+    if len(positionals) != 1 or any(kwargs.get("required") for _, kwargs in specs):
+        return None
+    values = dict(_spec_default(flags, kwargs) for flags, kwargs in specs)
+    values[positionals[0]] = argv[1]
+    return SimpleNamespace(cmd=argv[0], func=handler, **values)
 
 
 def main() -> None:
-    parser = build_parser()
-    args = parser.parse_args()
-    cmd = args.cmd
-    handlers = {
-        "inspect": inspect,
-        "status": status,
-        "run2llm": run2llm,
-        "run-status": run_status,
-        "list-traces": list_traces,
-        "list-sessions": list_sessions,
-        "session2runs": session2runs,
-        "trace2tree": trace2tree,
-        "trace2spans": trace2spans,
-        "trace2events": trace2events,
-        "trace2logs": trace2logs,
-        "find-errors": find_errors,
-        "search-logs": search_logs,
-    }
-    handler = handlers.get(cmd)
-    if not handler:
-        parser.error(f"Unknown command: {cmd}")
-    handler(args)
+    argv = sys.argv[1:]
+    args = _simple_args(argv) or build_parser(_sniff_subcommand(argv)).parse_args(argv)
+    args.func(args)
 
 
 if __name__ == "__main__":
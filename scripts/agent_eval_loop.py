@@ -3,21 +3,35 @@ from __future__ import annotations
 
 import argparse
 import ast
+import atexit
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import datetime as dt
+import functools
 import hashlib
 import json
 import os
+import queue
 import random
 import re
 import shutil
+import stat
 import subprocess
 import sys
 import textwrap
+import threading
 import time
 import uuid
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Harness logs and result rows can be large; use orjson when it is installed.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared.
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -27,6 +41,12 @@ DEFAULT_OTEL_DIR = ROOT / "bin" / "otel"
 DEFAULT_OTEL_PY = DEFAULT_OTEL_DIR / "_python"
 DEFAULT_OTEL_LOG_EVENT = DEFAULT_OTEL_DIR / "log_event.py"
 
+_GIT_CLONE_RE = re.compile(r"\bgit\s+clone\b")
+_OTEL_SECTION_RE = re.compile(r"(?m)^\[otel\]\s*$")
+_SLUG_UNSAFE_RE = re.compile(r"[^A-Za-z0-9._-]")
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.IGNORECASE | re.DOTALL)
+_TRUTHY = frozenset({"1", "true", "yes", "y", "on"})
+
 
 def now_iso() -> str:
     return dt.datetime.now(dt.UTC).isoformat()
@@ -36,6 +56,7 @@ def shell_join(values: list[str]) -> str:
     return ",".join(v for v in values if v)
 
 
+@functools.lru_cache(maxsize=16)
 def run_git_rev_parse(arg: str) -> str | None:
     try:
         out = subprocess.check_output(["git", "rev-parse", arg], cwd=ROOT, text=True)
@@ -50,11 +71,29 @@ def read_text(path: Path) -> str:
 
 def write_json(path: Path, payload: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    if orjson is not None:
+        try:
+            path.write_bytes(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2))
+            return
+        except TypeError:
+            pass  # same stdlib fallback as json_line
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False), encoding="utf-8")
 
 
 def load_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _json_loads(path.read_bytes())
+
+
+def json_line(payload: Any) -> str:
+    """Compact, key-sorted JSON for JSONL output (orjson when available)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+        except TypeError:
+            pass  # e.g. non-str keys or ints beyond 64 bits; the stdlib encoder handles them
+    # Same layout as orjson (compact separators, raw UTF-8) so rows.jsonl does
+    # not depend on whether orjson is installed or which rows fell back.
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
 
 def parse_csv(value: str) -> list[str]:
@@ -78,7 +117,7 @@ def parse_bool(value: Any, default: bool = False) -> bool:
     if isinstance(value, (int, float)):
         return value != 0
     if isinstance(value, str):
-        return value.strip().lower() in {"1", "true", "yes", "y", "on"}
+        return value.strip().lower() in _TRUTHY
     return default
 
 
@@ -163,11 +202,27 @@ def summarize_skill_text(text: str, limit: int = 1200) -> str:
 
 
 def _clear_symlinks(path: Path) -> None:
-    if not path.exists():
+    try:
+        it = os.scandir(path)
+    except (FileNotFoundError, NotADirectoryError):
         return
-    for child in path.iterdir():
-        if child.is_symlink():
-            child.unlink(missing_ok=True)
+    with it:
+        for entry in it:
+            if entry.is_symlink():
+                os.unlink(entry.path)
+
+
+def _clear_dir(path: Path) -> None:
+    """Remove every entry in path, leaving path itself in place."""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                try:
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
 
 
 def _remove_path(path: Path) -> None:
@@ -179,25 +234,58 @@ def _remove_path(path: Path) -> None:
         shutil.rmtree(path, ignore_errors=True)
 
 
+# (path, mtime_ns, size) -> bytes for the small CODEX_HOME files cloned into
+# every eval instance; each source is read once per run unless it changes.
+_SMALL_FILE_CACHE: dict[tuple[str, int, int], bytes] = {}
+
+
+def _copy_private_file(src: Path, dst: Path) -> bool:
+    """Copy src to dst with 0600 permissions; False when src is missing."""
+    try:
+        st = src.stat()
+    except FileNotFoundError:
+        return False
+    key = (str(src), st.st_mtime_ns, st.st_size)
+    buf = _SMALL_FILE_CACHE.get(key)
+    if buf is None:
+        buf = _SMALL_FILE_CACHE[key] = src.read_bytes()
+    # Not hardlinked: instances must not share (or chmod) the user's auth file.
+    fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(buf)
+    try:
+        dst.chmod(0o600)
+    except Exception:
+        pass
+    return True
+
+
 def _link_if_absent_or_stale(dst: Path, src: Path) -> None:
     if not src.exists():
         return
-    if dst.exists() and not dst.is_symlink():
-        return
-    if dst.is_symlink():
-        try:
-            if dst.resolve() == src.resolve():
-                return
-        except Exception:
-            pass
-        dst.unlink(missing_ok=True)
-    dst.symlink_to(src, target_is_directory=src.is_dir())
+    # One lstat + readlink instead of exists/is_symlink/resolve on both ends;
+    # a link is only kept when it names src exactly.
+    try:
+        st = os.lstat(dst)
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISLNK(st.st_mode):
+            return
+        if os.readlink(dst) == os.fspath(src):
+            return
+        os.unlink(dst)
+    os.symlink(src, dst)
 
 
+# The native env knobs are read from the environment once per process; the
+# eval loop does not change them mid-run.
+@functools.lru_cache(maxsize=None)
 def _native_docs_mode() -> str:
     return (os.environ.get("AGENT_EVAL_NATIVE_DOCS_MODE") or "toc").strip().lower()
 
 
+@functools.lru_cache(maxsize=None)
 def _native_skills_mount_mode() -> str:
     return (os.environ.get("AGENT_EVAL_NATIVE_SKILLS_MOUNT_MODE") or "symlink").strip().lower()
 
@@ -206,6 +294,7 @@ def _is_web_only_docs_mode(mode: str) -> bool:
     return mode in {"web-only", "web", "remote-only"}
 
 
+@functools.lru_cache(maxsize=None)
 def _resolve_native_docs_ref(mode: str | None = None) -> Path | None:
     refs_root = ROOT / ".agents" / "skills" / "pygraphistry" / "references"
     mirror_root = refs_root / "rtd-local"
@@ -267,8 +356,7 @@ def prepare_native_skill_env(
     if mount_mode == "symlink":
         _clear_symlinks(target_skills_dir)
     else:
-        for child in target_skills_dir.iterdir():
-            _remove_path(child)
+        _clear_dir(target_skills_dir)
 
     for skill in skill_names:
         src = ROOT / ".agents" / "skills" / skill
@@ -354,19 +442,12 @@ def prepare_codex_home(
     # include unrelated MCP/env secrets). A minimal config can be generated
     # below when OTel is enabled.
     for name in ("auth.json", "version.json"):
-        src = source_home / name
-        dst = codex_home / name
-        if src.exists():
-            shutil.copy2(src, dst)
-            try:
-                dst.chmod(0o600)
-            except Exception:
-                pass
+        _copy_private_file(source_home / name, codex_home / name)
 
     if otel_enabled:
         cfg_path = codex_home / "config.toml"
         cfg_text = cfg_path.read_text(encoding="utf-8") if cfg_path.exists() else ""
-        if not re.search(r"(?m)^\[otel\]\s*$", cfg_text):
+        if not _OTEL_SECTION_RE.search(cfg_text):
             endpoint = (otel_endpoint or "http://localhost:4317").strip()
             endpoint = endpoint.replace('"', '\\"')
             block = (
@@ -387,24 +468,19 @@ def spawn_codex_home_instance(
     instance_id: str,
 ) -> str:
     base = Path(base_codex_home)
-    slug = re.sub(r"[^A-Za-z0-9._-]", "_", instance_id)[:24] or "instance"
+    slug = _SLUG_UNSAFE_RE.sub("_", instance_id)[:24] or "instance"
     suffix = f"{slug}-{uuid.uuid4().hex[:12]}"
     target = base.parent / "instances" / f"{mode}-{suffix}"
     target.mkdir(parents=True, exist_ok=True)
 
     for name in ("auth.json", "version.json", "config.toml"):
-        src = base / name
-        dst = target / name
-        if src.exists():
-            shutil.copy2(src, dst)
-            try:
-                dst.chmod(0o600)
-            except Exception:
-                pass
+        _copy_private_file(base / name, target / name)
 
     src_skills = base / "skills"
     dst_skills = target / "skills"
     if src_skills.exists():
+        # Real copies: parallel instances may rewrite skill files (e.g. codex
+        # refreshing skills/.system) and must not share inodes with the base.
         shutil.copytree(src_skills, dst_skills, dirs_exist_ok=True, symlinks=True)
 
     return str(target)
@@ -508,6 +584,69 @@ def make_traceparent() -> tuple[str, str]:
     return traceparent, trace_id
 
 
+# Non-debug OTel events go to one long-lived `log_event.py --stdin-jsonl` process
+# instead of a fresh interpreter (and SDK import) per event. A writer thread feeds
+# it so a slow export never blocks the eval loop.
+_OTEL_LOCK = threading.Lock()
+_OTEL_PROC: subprocess.Popen[bytes] | None = None
+_OTEL_QUEUE: queue.Queue[bytes | None] | None = None
+_OTEL_WRITER: threading.Thread | None = None
+
+
+def _write_otel_frames(proc: subprocess.Popen[bytes], frames: queue.Queue[bytes | None]) -> None:
+    assert proc.stdin is not None
+    try:
+        while True:
+            frame = frames.get()
+            if frame is None:
+                break
+            proc.stdin.write(frame)
+            proc.stdin.flush()
+    except OSError:
+        pass  # worker exited; remaining events are dropped, as failed emits always were
+    finally:
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+
+
+def _close_otel_worker() -> None:
+    """Flush queued events and wait for the worker to export them (atexit)."""
+    with _OTEL_LOCK:
+        proc, frames, writer = _OTEL_PROC, _OTEL_QUEUE, _OTEL_WRITER
+    if proc is None or frames is None or writer is None:
+        return
+    frames.put(None)
+    writer.join(timeout=30)
+    try:
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def _otel_worker_queue(py_cmd: Path, log_script: Path) -> queue.Queue[bytes | None] | None:
+    """Start the event worker on first use and return its frame queue (None if it cannot start)."""
+    global _OTEL_PROC, _OTEL_QUEUE, _OTEL_WRITER
+    with _OTEL_LOCK:
+        if _OTEL_QUEUE is None:
+            try:
+                proc = subprocess.Popen(
+                    [str(py_cmd), str(log_script), "--stdin-jsonl"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError:
+                return None
+            frames: queue.Queue[bytes | None] = queue.Queue()
+            writer = threading.Thread(target=_write_otel_frames, args=(proc, frames), name="otel-events", daemon=True)
+            writer.start()
+            _OTEL_PROC, _OTEL_QUEUE, _OTEL_WRITER = proc, frames, writer
+            atexit.register(_close_otel_worker)
+        return _OTEL_QUEUE
+
+
 def emit_otel_event(
     enabled: bool,
     event_name: str,
@@ -523,6 +662,20 @@ def emit_otel_event(
     if not py_cmd.exists() or not log_script.exists():
         return
 
+    debug = os.environ.get("AGENT_EVAL_OTEL_DEBUG", "").strip().lower() in {"1", "true", "yes", "on"}
+    if not debug:
+        frames = _otel_worker_queue(py_cmd, log_script)
+        if frames is not None:
+            event = {
+                "message": event_name,
+                "service": service,
+                "endpoint": endpoint,
+                "attrs": {key: str(value) for key, value in attrs.items()},
+            }
+            frames.put((json_line(event) + "\n").encode("utf-8"))
+        return
+
+    # Debug: one process per event so each failure is reported with its output.
     cmd = [str(py_cmd), str(log_script), event_name, "--service", service]
     if endpoint:
         cmd.extend(["--endpoint", endpoint])
@@ -530,16 +683,8 @@ def emit_otel_event(
     for key, value in attrs.items():
         cmd.extend(["--attr", f"{key}={value}"])
 
-    debug = os.environ.get("AGENT_EVAL_OTEL_DEBUG", "").strip().lower() in {"1", "true", "yes", "on"}
-    proc = subprocess.run(
-        cmd,
-        check=False,
-        capture_output=debug,
-        text=True,
-        stdout=subprocess.DEVNULL if not debug else None,
-        stderr=subprocess.DEVNULL if not debug else None,
-    )
-    if debug and proc.returncode != 0:
+    proc = subprocess.run(cmd, check=False, capture_output=True, text=True)
+    if proc.returncode != 0:
         stderr_tail = (proc.stderr or "").strip()[-2000:]
         stdout_tail = (proc.stdout or "").strip()[-1000:]
         print(
@@ -550,6 +695,28 @@ def emit_otel_event(
         )
 
 
+def _iter_lines_reversed(data: bytes) -> Iterator[bytes]:
+    """Yield lines from the end of data without splitting all of it up front."""
+    end = len(data)
+    while end > 0:
+        start = data.rfind(b"\n", 0, end) + 1
+        yield data[start:end]
+        end = start - 1
+
+
+def _decode_tail(data: bytes | str | None, limit: int = 2000) -> str:
+    """Decode only the last limit bytes of captured output."""
+    if not data:
+        return ""
+    if isinstance(data, str):
+        return data[-limit:]
+    return data[-limit:].decode("utf-8", errors="replace")
+
+
+# out_dirs whose raw/ directory already exists; run_harness creates it once.
+_RAW_DIRS_READY: set[Path] = set()
+
+
 def run_harness(
     harness: str,
     prompt: str,
@@ -578,7 +745,9 @@ def run_harness(
     skills_file = out_dir / "raw" / f"{safe}.skills.txt"
     raw_out = out_dir / "raw" / f"{safe}.log"
 
-    prompt_file.parent.mkdir(parents=True, exist_ok=True)
+    if out_dir not in _RAW_DIRS_READY:
+        prompt_file.parent.mkdir(parents=True, exist_ok=True)
+        _RAW_DIRS_READY.add(out_dir)
     prompt_file.write_text(prompt, encoding="utf-8")
     skills_file.write_text(skills_text, encoding="utf-8")
 
@@ -604,15 +773,13 @@ def run_harness(
 
     started = time.time()
     try:
-        child_env = os.environ.copy()
-        if harness_env:
-            child_env.update(harness_env)
+        # env=None lets the child inherit os.environ without building a copy.
+        child_env = {**os.environ, **harness_env} if harness_env else None
         proc = subprocess.run(
             cmd,
             cwd=ROOT,
             env=child_env,
             capture_output=True,
-            text=True,
             timeout=timeout_s + 10,
         )
         elapsed_ms = int((time.time() - started) * 1000)
@@ -625,19 +792,22 @@ def run_harness(
             "response_text": "",
             "latency_ms": elapsed_ms,
             "raw_ref": str(raw_out),
-            "stdout_tail": (exc.stdout or "")[-2000:],
-            "stderr_tail": (exc.stderr or "")[-2000:],
+            "stdout_tail": _decode_tail(exc.stdout),
+            "stderr_tail": _decode_tail(exc.stderr),
             "command_exit_code": None,
         }
 
     payload: dict[str, Any] | None = None
+    # Output stays bytes: only the result line is parsed (both JSON backends
+    # accept bytes) and only the tails below are decoded.
     stdout = proc.stdout.strip()
-    for line in reversed(stdout.splitlines()):
+    for line in _iter_lines_reversed(stdout):
         line = line.strip()
-        if not line:
+        # The result is one JSON object per line; skip log lines without parsing.
+        if not line.startswith(b"{"):
             continue
         try:
-            parsed = json.loads(line)
+            parsed = _json_loads(line)
             if isinstance(parsed, dict):
                 payload = parsed
                 break
@@ -651,8 +821,8 @@ def run_harness(
             "error": "Harness did not emit JSON payload",
             "response_text": "",
             "latency_ms": elapsed_ms,
-            "stdout_tail": stdout[-2000:],
-            "stderr_tail": proc.stderr[-2000:],
+            "stdout_tail": _decode_tail(stdout),
+            "stderr_tail": _decode_tail(proc.stderr),
             "raw_ref": str(raw_out),
         }
 
@@ -669,44 +839,69 @@ def run_harness(
     return payload
 
 
-def extract_json_object(text: str) -> dict[str, Any] | None:
-    candidates: list[str] = []
+def _iter_brace_objects(text: str, track_strings: bool = True) -> Iterator[str]:
+    """Yield balanced {...} spans of text in order of their opening brace, in one pass.
+
+    With track_strings, braces inside JSON string literals are ignored; without
+    it every brace counts, as a plain depth scan would. Spans nested in a '{'
+    that is never closed are yielded once the end of text shows it is unbalanced.
+    """
+    # Each open brace keeps the spans closed directly inside it, in case it never closes.
+    stack: list[tuple[int, list[str]]] = []
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == "{":
+            stack.append((i, []))
+        elif ch == "}":
+            if not stack:
+                continue
+            start, _ = stack.pop()
+            if stack:
+                stack[-1][1].append(text[start : i + 1])
+            else:
+                yield text[start : i + 1]
+        elif ch == '"' and stack and track_strings:
+            in_string = True
+    for _, closed in stack:
+        yield from closed
+
+
+def _json_object_candidates(text: str) -> Iterator[str]:
+    """Yield candidate JSON texts lazily, cheapest first."""
     raw = text.strip()
     if raw:
-        candidates.append(raw)
+        yield raw
 
-    for match in re.finditer(r"```(?:json)?\s*(\{.*?\})\s*```", text, flags=re.IGNORECASE | re.DOTALL):
+    for match in _JSON_BLOCK_RE.finditer(text):
         block = match.group(1).strip()
         if block:
-            candidates.append(block)
+            yield block
 
     # Fallback: try the first balanced {...} object.
-    start = text.find("{")
-    while start != -1:
-        depth = 0
-        for i in range(start, len(text)):
-            ch = text[i]
-            if ch == "{":
-                depth += 1
-            elif ch == "}":
-                depth -= 1
-                if depth == 0:
-                    blob = text[start : i + 1].strip()
-                    if blob:
-                        candidates.append(blob)
-                    start = -1
-                    break
-        if start == -1:
-            break
-        start = text.find("{", start + 1)
-
-    seen: set[str] = set()
-    for candidate in candidates:
-        if candidate in seen:
-            continue
-        seen.add(candidate)
+    blob = next(_iter_brace_objects(text), None)
+    if blob:
+        yield blob
+    # A stray '"' in prose before the JSON (sloppy model output) leaves the
+    # string-aware scan stuck inside a "string"; retry counting every brace.
+    plain_blob = next(_iter_brace_objects(text, track_strings=False), None)
+    if plain_blob and plain_blob != blob:
+        yield plain_blob
+
+
+def extract_json_object(text: str) -> dict[str, Any] | None:
+    # Later candidates are only scanned for if earlier ones fail to parse; a
+    # rare duplicate candidate just costs one extra parse attempt.
+    for candidate in _json_object_candidates(text):
         try:
-            parsed = json.loads(candidate)
+            parsed = _json_loads(candidate)
             if isinstance(parsed, dict):
                 return parsed
         except Exception:
@@ -734,7 +929,7 @@ def grade_response_oracle(
     *,
     eval_prompt: str,
     response_text: str,
-    checks: dict[str, Any],
+    checks_json: str,
     oracle_cfg: dict[str, Any],
     out_dir: Path,
     timeout_s: int,
@@ -755,6 +950,14 @@ def grade_response_oracle(
     forbidden_concepts = [str(v) for v in (oracle_cfg.get("forbidden_concepts") or []) if str(v).strip()]
     reference_answer = str(oracle_cfg.get("reference_answer") or "").strip()
 
+    prompt_body = truncate_text(eval_prompt, 2400)
+    checks_body = truncate_text(checks_json, 2000)
+    reference_body = truncate_text(reference_answer, 2400)
+    rubric_body = truncate_text(rubric, 2000)
+    required_body = truncate_text(maybe_json_dumps(required_concepts), 1000)
+    forbidden_body = truncate_text(maybe_json_dumps(forbidden_concepts), 1000)
+    response_body = truncate_text(response_text, 8000)
+
     judge_prompt = textwrap.dedent(
         f"""
         You are a strict evaluator for an LLM benchmark case.
@@ -771,31 +974,31 @@ def grade_response_oracle(
         Penalize hallucinations, unsafe credential handling, and missing required steps.
 
         [EVAL_PROMPT]
-        {truncate_text(eval_prompt, 2400)}
+        {prompt_body}
         [/EVAL_PROMPT]
 
         [DETERMINISTIC_CHECKS_JSON]
-        {truncate_text(maybe_json_dumps(checks), 2000)}
+        {checks_body}
         [/DETERMINISTIC_CHECKS_JSON]
 
         [REFERENCE_ANSWER]
-        {truncate_text(reference_answer, 2400)}
+        {reference_body}
         [/REFERENCE_ANSWER]
 
         [RUBRIC]
-        {truncate_text(rubric, 2000)}
+        {rubric_body}
         [/RUBRIC]
 
         [REQUIRED_CONCEPTS]
-        {truncate_text(maybe_json_dumps(required_concepts), 1000)}
+        {required_body}
         [/REQUIRED_CONCEPTS]
 
         [FORBIDDEN_CONCEPTS]
-        {truncate_text(maybe_json_dumps(forbidden_concepts), 1000)}
+        {forbidden_body}
         [/FORBIDDEN_CONCEPTS]
 
         [CANDIDATE_RESPONSE]
-        {truncate_text(response_text, 8000)}
+        {response_body}
         [/CANDIDATE_RESPONSE]
         """
     ).strip()
@@ -890,64 +1093,66 @@ def extract_trace_features(raw_ref: str | None) -> dict[str, Any]:
         return features
 
     try:
-        raw_text = raw_path.read_text(encoding="utf-8", errors="replace")
+        # Stream the log: harness logs can be many MB and only one line is needed at a time.
+        raw_file = raw_path.open(encoding="utf-8", errors="replace", buffering=1 << 17)
     except Exception:
         return features
 
-    for line in raw_text.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            payload = json.loads(line)
-        except Exception:
-            continue
+    with raw_file:
+        for line in raw_file:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                payload = _json_loads(line)
+            except Exception:
+                continue
 
-        # Codex format: item.completed with function_call or command_execution
-        if payload.get("type") == "item.completed":
-            item = payload.get("item") or {}
-            item_type = item.get("type") or ""
-
-            # Codex command_execution events
-            if item_type == "command_execution":
-                cmd = item.get("command") or ""
-                if cmd:
-                    features["commands"].append(cmd)
-                    if re.search(r"\bgit\s+clone\b", cmd):
-                        features["git_clone_count"] += 1
-
-            # function_call events (other harnesses)
-            elif item_type == "function_call":
-                name = item.get("name") or ""
-                args_raw = item.get("arguments") or "{}"
-                try:
-                    args = json.loads(args_raw) if isinstance(args_raw, str) else args_raw
-                except Exception:
-                    args = {}
+            # Codex format: item.completed with function_call or command_execution
+            if payload.get("type") == "item.completed":
+                item = payload.get("item") or {}
+                item_type = item.get("type") or ""
 
-                if name == "shell":
-                    cmd = args.get("command") or args.get("cmd") or ""
+                # Codex command_execution events
+                if item_type == "command_execution":
+                    cmd = item.get("command") or ""
                     if cmd:
                         features["commands"].append(cmd)
-                        if re.search(r"\bgit\s+clone\b", cmd):
+                        if _GIT_CLONE_RE.search(cmd):
                             features["git_clone_count"] += 1
 
-                elif name in {"web_search", "webSearch"}:
-                    features["web_search_count"] += 1
-
-                elif name in {"open_page", "openPage", "web_fetch", "webFetch"}:
-                    features["open_page_count"] += 1
-                    url = args.get("url") or ""
-                    if not url.strip():
-                        features["open_page_empty_count"] += 1
-                    else:
-                        try:
-                            from urllib.parse import urlparse
-                            parsed = urlparse(url)
-                            if parsed.netloc:
-                                features["domains_used"].add(parsed.netloc.lower())
-                        except Exception:
-                            pass
+                # function_call events (other harnesses)
+                elif item_type == "function_call":
+                    name = item.get("name") or ""
+                    args_raw = item.get("arguments") or "{}"
+                    try:
+                        args = _json_loads(args_raw) if isinstance(args_raw, str) else args_raw
+                    except Exception:
+                        args = {}
+
+                    if name == "shell":
+                        cmd = args.get("command") or args.get("cmd") or ""
+                        if cmd:
+                            features["commands"].append(cmd)
+                            if _GIT_CLONE_RE.search(cmd):
+                                features["git_clone_count"] += 1
+
+                    elif name in {"web_search", "webSearch"}:
+                        features["web_search_count"] += 1
+
+                    elif name in {"open_page", "openPage", "web_fetch", "webFetch"}:
+                        features["open_page_count"] += 1
+                        url = args.get("url") or ""
+                        if not url.strip():
+                            features["open_page_empty_count"] += 1
+                        else:
+                            try:
+                                from urllib.parse import urlparse
+                                parsed = urlparse(url)
+                                if parsed.netloc:
+                                    features["domains_used"].add(parsed.netloc.lower())
+                            except Exception:
+                                pass
 
     # Convert set to sorted list for JSON serialization
     features["domains_used"] = sorted(features["domains_used"])
@@ -1512,6 +1717,11 @@ def summarize_rows(rows: list[dict[str, Any]]) -> dict[str, Any]:
 
 
 def parse_args() -> argparse.Namespace:
+    try:
+        default_max_workers = int(os.environ.get("AGENT_EVAL_CONCURRENCY") or 1)
+    except ValueError:
+        default_max_workers = 1
+
     parser = argparse.ArgumentParser(description="Run eval loops across codex/claude/louie harnesses")
     parser.add_argument("--journeys", default="runtime_smoke", help="CSV of journey IDs or 'all'")
     parser.add_argument("--journey-dir", default=str(DEFAULT_JOURNEY_DIR), help="Journey JSON directory")
@@ -1563,7 +1773,12 @@ def parse_args() -> argparse.Namespace:
         help="How skills are provided to harnesses: native (default), inject, or auto (native for codex/claude + inject for others)",
     )
     parser.add_argument("--timeout-s", type=int, default=240, help="Timeout for each harness invocation")
-    parser.add_argument("--max-workers", type=int, default=1, help="Max parallel harness workers per case (>=1)")
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=default_max_workers,
+        help="Max parallel harness workers, shared by the whole run (>=1, default: AGENT_EVAL_CONCURRENCY or 1)",
+    )
     return parser.parse_args()
 
 
@@ -1754,6 +1969,9 @@ def main() -> int:
 
     rows: list[dict[str, Any]] = []
     rows_path = out_dir / "rows.jsonl"
+    # One pool for the whole run: harness/oracle calls block on subprocesses,
+    # so threads overlap them without re-spawning workers for every case.
+    harness_pool = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
 
     with rows_path.open("w", encoding="utf-8") as rows_file:
         for journey in journeys:
@@ -1776,6 +1994,8 @@ def main() -> int:
                 case_id = str(case.get("id") or f"case_{len(rows) + 1}")
                 prompt = str(case.get("prompt") or "").strip()
                 checks = case.get("checks") if isinstance(case.get("checks"), dict) else {}
+                # Serialized once per case; the oracle judges it for every mode/variant.
+                checks_json = maybe_json_dumps(checks)
 
                 for mode in modes:
                     skills_cfg = skill_configs[mode]
@@ -1933,7 +2153,7 @@ def main() -> int:
                             oracle_grade = grade_response_oracle(
                                 eval_prompt=prompt,
                                 response_text=response_text,
-                                checks=checks,
+                                checks_json=checks_json,
                                 oracle_cfg=oracle_cfg,
                                 out_dir=out_dir,
                                 timeout_s=args.oracle_timeout_s,
@@ -2098,21 +2318,19 @@ def main() -> int:
                             )
 
                         rows.append(row)
-                        rows_file.write(json.dumps(row, sort_keys=True) + "\n")
+                        rows_file.write(json_line(row) + "\n")
                         rows_file.flush()
 
-                    worker_count = min(max_workers, len(harness_variants)) if harness_variants else 1
-                    if worker_count <= 1 or len(harness_variants) <= 1:
+                    if harness_pool is None or len(harness_variants) <= 1:
                         for harness_idx, harness_variant in enumerate(harness_variants):
                             persist_row(run_case_for_harness(harness_idx, harness_variant))
                     else:
-                        with ThreadPoolExecutor(max_workers=worker_count) as pool:
-                            futures = [
-                                pool.submit(run_case_for_harness, harness_idx, harness_variant)
-                                for harness_idx, harness_variant in enumerate(harness_variants)
-                            ]
-                            for fut in as_completed(futures):
-                                persist_row(fut.result())
+                        futures = [
+                            harness_pool.submit(run_case_for_harness, harness_idx, harness_variant)
+                            for harness_idx, harness_variant in enumerate(harness_variants)
+                        ]
+                        for fut in as_completed(futures):
+                            persist_row(fut.result())
 
                     emit_otel_event(
                         enabled=args.otel,
@@ -2139,6 +2357,9 @@ def main() -> int:
                 endpoint=args.otel_endpoint or None,
             )
 
+    if harness_pool is not None:
+        harness_pool.shutdown()
+
     summary = summarize_rows(rows)
     otel_endpoint = (args.otel_endpoint or os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT_GRPC") or "http://localhost:4317")
     otel_ids = {